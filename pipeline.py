@@ -26,46 +26,82 @@ import argparse
 from pathlib import Path
 from typing import Optional, List
 import shutil
-import subprocess
-import json
 import re
 import os
+import functools
+from collections import Counter
+from operator import attrgetter
 
 # Add scripts directory to path
 SCRIPTS_DIR = Path(__file__).parent / 'scripts'
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-from cv_parser import CVParser  # noqa: E402
-from generate_tasks import generate_tasks_json  # noqa: E402
 from cv_utils import Colors  # noqa: E402
 
+# cv_parser, generate_tasks, json, subprocess and concurrent.futures are
+# imported inside the commands that use them so that quick commands (--list, --status, the
+# interactive menu) don't pay for them at startup.
+
+
+# LaTeX build artifacts removed by clean_build_artifacts()
+ARTIFACT_SUFFIXES = frozenset([
+    '.aux', '.log', '.out', '.toc', '.fdb_latexmk',
+    '.fls', '.bbl', '.blg', '.bcf', '.idx', '.ilg',
+    '.ind', '.lof', '.lot', '.nav', '.snm', '.vrb', '.xdv',
+])
+ARTIFACT_MULTIDOT_SUFFIXES = ('.synctex.gz', '.run.xml')
+# Package/font files from texmf/ that may have been linked into the project root
+TEXMF_SUFFIXES = frozenset(['.sty', '.cls', '.def', '.fd', '.otf', '.ttf', '.pfb'])
+
+# Precompiled patterns for version handling and validation
+_OUTPUT_VERSION_RE = re.compile(r'\\newcommand\{\\OutputVersion\}\s*\{([^}]+)\}')
+# The definition line, plus its argument when that sits on the following line
+_OUTPUT_VERSION_LINE_RE = re.compile(
+    r'^[ \t]*\\newcommand\{\\OutputVersion\}(?:\s*\{[^}]*\})?[^\r\n]*', re.M)
+_NORMALIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_PLACEHOLDER_RE = re.compile(r'\[[A-Z][^\]]*\]')
+_BEGIN_RE = re.compile(r'\\begin\{([^}]+)\}')
+_END_RE = re.compile(r'\\end\{([^}]+)\}')
+# Control characters other than tab, newline and carriage return
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+# Unescaped braces, escaped braces (ignored) and line breaks
+_BRACE_TOKEN_RE = re.compile(r'\\[{}]|[{}]|\n')
+_TRAILING_WS_RE = re.compile(r'[ \t]$', re.M)
+
 
 # Helper functions to work with existing scripts
-def get_available_versions() -> List[str]:
-    """Get list of available versions from _content/."""
-    content_path = Path.cwd() / '_content'
-    if not content_path.exists():
-        return []
+@functools.lru_cache(maxsize=8)
+def _scan_versions(content_path: Path, mtime_ns: int) -> tuple:
+    """Scan content_path for version directories.
 
-    versions = sorted([
-        d.name for d in content_path.iterdir()
-        if d.is_dir() and not d.name.startswith('_')
-    ])
-    return versions
+    mtime_ns only keys the cache: adding, removing or renaming a version
+    changes the directory's mtime and forces a fresh scan.
+    """
+    try:
+        with os.scandir(content_path) as it:
+            names = [
+                entry.name for entry in it
+                if entry.is_dir() and not entry.name.startswith('_')
+            ]
+    except FileNotFoundError:
+        return ()
 
+    names.sort()
+    return tuple(names)
 
-def get_current_version() -> str:
-    """Get the current version from cv-version.tex."""
-    version_file = Path.cwd() / 'cv-version.tex'
 
-    if not version_file.exists():
-        return 'default'
+@functools.lru_cache(maxsize=8)
+def _read_current_version(version_file: Path, mtime_ns: int, size: int) -> str:
+    """Read the version name from version_file.
 
+    mtime_ns and size are only part of the cache key, so an edit to the
+    file made outside this process is picked up on the next call.
+    """
     try:
         with open(version_file, 'r', encoding='utf-8') as f:
             content = f.read()
             # Extract version from \newcommand{\OutputVersion}{version_name}
-            match = re.search(r'\\newcommand\{\\OutputVersion\}\{([^}]+)\}', content)
+            match = _OUTPUT_VERSION_RE.search(content)
             if match:
                 return match.group(1)
     except Exception:
@@ -74,17 +110,44 @@ def get_current_version() -> str:
     return 'default'
 
 
-def get_version_status(version: str) -> str:
-    """Get status indicator for a version."""
+def invalidate_caches() -> None:
+    """Forget cached version data after a command or a mutating operation."""
+    _scan_versions.cache_clear()
+    _read_current_version.cache_clear()
+    _cached_status.cache_clear()
+
+
+def get_available_versions() -> List[str]:
+    """Get list of available versions from _content/."""
     content_path = Path.cwd() / '_content'
-    version_dir = content_path / version
+    try:
+        mtime_ns = content_path.stat().st_mtime_ns
+    except OSError:
+        return []
+    return list(_scan_versions(content_path, mtime_ns))
 
-    if not version_dir.exists():
+
+def get_current_version() -> str:
+    """Get the current version from cv-version.tex."""
+    version_file = Path.cwd() / 'cv-version.tex'
+    try:
+        st = version_file.stat()
+    except OSError:
+        return 'default'
+    return _read_current_version(version_file, st.st_mtime_ns, st.st_size)
+
+
+def _status_from_scandir(version_dir) -> str:
+    """Compute the status indicator for version_dir from one directory read."""
+    try:
+        with os.scandir(version_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
         return '[Not Found]'
 
-    has_tagline = (version_dir / "tagline.tex").exists()
-    has_experience = (version_dir / "experience.tex").exists()
-    has_cover_letter = (version_dir / "cover_letter.tex").exists()
+    has_tagline = "tagline.tex" in names
+    has_experience = "experience.tex" in names
+    has_cover_letter = "cover_letter.tex" in names
 
     if has_tagline and has_experience and has_cover_letter:
         return '[Complete]'
@@ -96,9 +159,41 @@ def get_version_status(version: str) -> str:
         return '[Empty]'
 
 
+@functools.lru_cache(maxsize=64)
+def _cached_status(version_dir: str, mtime_ns: int) -> str:
+    """Status of version_dir; mtime_ns changes whenever a file is added or removed."""
+    return _status_from_scandir(version_dir)
+
+
+def get_version_status(version: str) -> str:
+    """Get status indicator for a version."""
+    version_dir = os.path.join(os.getcwd(), '_content', version)
+    try:
+        mtime_ns = os.stat(version_dir).st_mtime_ns
+    except OSError:
+        return '[Not Found]'
+    return _cached_status(version_dir, mtime_ns)
+
+
+def iter_versions_with_status():
+    """Yield (version, status) pairs for all versions in _content/, sorted by name."""
+    try:
+        with os.scandir(Path.cwd() / '_content') as it:
+            entries = [
+                entry for entry in it
+                if entry.is_dir() and not entry.name.startswith('_')
+            ]
+    except FileNotFoundError:
+        return
+
+    for entry in sorted(entries, key=attrgetter('name')):
+        yield entry.name, _status_from_scandir(entry.path)
+
+
 def update_version(version: str) -> None:
     """Update the version in cv-version.tex."""
     version_file = Path.cwd() / 'cv-version.tex'
+    invalidate_caches()
 
     if not version_file.exists():
         # If file doesn't exist, create with minimal content
@@ -106,25 +201,47 @@ def update_version(version: str) -> None:
         version_file.write_text(content, encoding='utf-8')
         return
 
-    # Read all lines and replace only the \newcommand line
-    lines = version_file.read_text(encoding='utf-8').splitlines()
-    new_lines = []
-    found = False
-    for line in lines:
-        if line.strip().startswith('\\newcommand{\\OutputVersion}'):
-            new_lines.append(f"\\newcommand{{\\OutputVersion}}{{{version}}}")
-            found = True
-        else:
-            new_lines.append(line)
+    # Replace only the \newcommand line, leaving the rest of the file as-is
+    command = f"\\newcommand{{\\OutputVersion}}{{{version}}}"
+    content = version_file.read_text(encoding='utf-8')
+    content, found = _OUTPUT_VERSION_LINE_RE.subn(lambda _: command, content)
     if not found:
         # If the command was not found, append it at the end
-        new_lines.append(f"\\newcommand{{\\OutputVersion}}{{{version}}}")
-    version_file.write_text('\n'.join(new_lines) + '\n', encoding='utf-8')
+        if content and not content.endswith('\n'):
+            content += '\n'
+        content += command + '\n'
+    version_file.write_text(content, encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _ansi_supported() -> bool:
+    """Return True if stdout understands ANSI escapes, enabling them on Windows 10+."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+# Home the cursor, clear the screen and the scrollback, as `clear` does
+_CLEAR_SEQUENCE = '\033[H\033[2J\033[3J'
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _ansi_supported():
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
 
 
 def print_header(text: str):
@@ -185,7 +302,7 @@ def create_new_version(version_name: Optional[str] = None) -> bool:
         return False
 
     # Normalize version name
-    normalized = re.sub(r'[^a-zA-Z0-9_-]', '', version_name.replace(' ', '_').lower())
+    normalized = _NORMALIZE_RE.sub('', version_name.replace(' ', '_').lower())
     if version_name != normalized:
         print_warning(f"Version name '{version_name}' is not in the recommended format.")
         print_info(f"Suggested: {Colors.CYAN}{normalized}{Colors.ENDC}")
@@ -197,7 +314,7 @@ def create_new_version(version_name: Optional[str] = None) -> bool:
             if not version_name:
                 print_error("Version name cannot be empty")
                 return False
-            version_name = re.sub(r'[^a-zA-Z0-9_-]', '', version_name.replace(' ', '_').lower())
+            version_name = _NORMALIZE_RE.sub('', version_name.replace(' ', '_').lower())
         else:
             print_info("Cancelled")
             return False
@@ -220,7 +337,10 @@ def create_new_version(version_name: Optional[str] = None) -> bool:
     print(f"  Path: {Colors.CYAN}{new_version_dir.relative_to(base_path)}{Colors.ENDC}")
     print(f"\n{Colors.BOLD}Files to be created:{Colors.ENDC}")
 
-    template_files = sorted([f.name for f in template_dir.glob('*.tex')])
+    # One directory pass serves both the preview and the copy below
+    with os.scandir(template_dir) as it:
+        template_entries = [e for e in it if e.name != '.gitignore']
+    template_files = sorted(e.name for e in template_entries if e.name.endswith('.tex'))
     for file in template_files:
         print(f"  - {file}")
 
@@ -233,13 +353,13 @@ def create_new_version(version_name: Optional[str] = None) -> bool:
     # Copy template, skipping .gitignore
     try:
         new_version_dir.mkdir(parents=True, exist_ok=False)
-        for item in template_dir.iterdir():
-            if item.name == '.gitignore':
-                continue
-            if item.is_file():
-                shutil.copy2(item, new_version_dir / item.name)
-            elif item.is_dir():
-                shutil.copytree(item, new_version_dir / item.name)
+        invalidate_caches()
+        for entry in template_entries:
+            if entry.is_file():
+                shutil.copyfile(entry.path, new_version_dir / entry.name)
+            elif entry.is_dir():
+                shutil.copytree(entry.path, new_version_dir / entry.name,
+                                copy_function=shutil.copyfile)
         print_success(f"Created new version: {version_name}")
 
         # Ask if user wants to switch to it
@@ -270,7 +390,8 @@ def select_version_interactive() -> bool:
     clear_screen()
     print(f"\n  {Colors.DIM}Resume Pipeline{Colors.ENDC} {Colors.CYAN}›{Colors.ENDC} {Colors.BOLD}Switch Version{Colors.ENDC}\n")  # noqa e501
 
-    versions = get_available_versions()
+    versions_with_status = list(iter_versions_with_status())
+    versions = [version for version, _ in versions_with_status]
     current = get_current_version()
 
     if not versions:
@@ -281,8 +402,7 @@ def select_version_interactive() -> bool:
     print(f"  {Colors.DIM}Legend: {Colors.GREEN}●{Colors.ENDC} Complete  {Colors.CYAN}●{Colors.ENDC} Resume Ready  {Colors.YELLOW}●{Colors.ENDC} Partial{Colors.ENDC}\n") # noqa e501
 
     # Display versions with status
-    for i, version in enumerate(versions, 1):
-        status = get_version_status(version)
+    for i, (version, status) in enumerate(versions_with_status, 1):
         current_marker = f" {Colors.DIM}(current){Colors.ENDC}" if version == current else ""
 
         # Color-code status
@@ -331,17 +451,16 @@ def list_versions() -> None:
     """List all available versions with their status."""
     print_header("Available Resume Versions")
 
-    versions = get_available_versions()
+    versions_with_status = list(iter_versions_with_status())
     current = get_current_version()
 
-    if not versions:
+    if not versions_with_status:
         print_error("No versions found in _content/")
         return
 
     print(f"Current version: {Colors.CYAN}{Colors.BOLD}{current}{Colors.ENDC}\n")
 
-    for version in versions:
-        status = get_version_status(version)
+    for version, status in versions_with_status:
         current_marker = " ← current" if version == current else ""
 
         # Color-code status
@@ -370,14 +489,20 @@ def build_resume(version: Optional[str] = None) -> bool:
     print_header(f"Building Resume & Cover Letter: {version}")
 
     try:
-        # Run build script for both resume and cover letter
-        result = subprocess.run(
-            [sys.executable, str(SCRIPTS_DIR / 'build.py')],
-            capture_output=True,
-            text=True
-        )
-
-        print(result.stdout)
+        import subprocess
+
+        # Run build script for both resume and cover letter, relaying its
+        # output as it arrives (-u stops the child from block-buffering the pipe)
+        with subprocess.Popen(
+            [sys.executable, '-u', str(SCRIPTS_DIR / 'build.py')],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+            returncode = proc.wait()
 
         # Check for cover letter section
         content_dir = Path.cwd() / '_content' / version
@@ -385,13 +510,11 @@ def build_resume(version: Optional[str] = None) -> bool:
         if not cover_letter_path.exists():
             print_warning("No cover letter section found for this version. Skipping cover letter build.")
 
-        if result.returncode == 0:
+        if returncode == 0:
             print_success(f"Resume and cover letter build complete for version: {version}")
             return True
         else:
             print_error("Build failed")
-            if result.stderr:
-                print(result.stderr)
             return False
 
     except Exception as e:
@@ -410,6 +533,8 @@ def refresh_library() -> bool:
     print_info("Parsing all CV versions...")
 
     try:
+        from cv_parser import CVParser
+
         parser = CVParser()
 
         print_info("Parsing CV files...")
@@ -442,6 +567,9 @@ def refresh_vscode_tasks() -> bool:
         versions = get_available_versions()
 
         # Generate tasks JSON structure
+        import json
+        from generate_tasks import generate_tasks_json
+
         tasks_dict = generate_tasks_json(versions)
 
         # Write to .vscode/tasks.json
@@ -449,8 +577,8 @@ def refresh_vscode_tasks() -> bool:
         vscode_dir.mkdir(exist_ok=True)
 
         tasks_file = vscode_dir / 'tasks.json'
-        with open(tasks_file, 'w', encoding='utf-8') as f:
-            json.dump(tasks_dict, f, indent=4, ensure_ascii=False)
+        # Serialize in one call and write once rather than streaming small chunks
+        tasks_file.write_text(json.dumps(tasks_dict, indent=4, ensure_ascii=False), encoding='utf-8')
 
         print_success("VS Code tasks updated successfully!")
         print_info(f"Updated {tasks_file.relative_to(Path.cwd())} with {len(versions)} versions")
@@ -460,6 +588,69 @@ def refresh_vscode_tasks() -> bool:
         return False
 
 
+def _iter_pycache(root: str):
+    """Yield paths of __pycache__ directories below root without following symlinks."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name == '__pycache__':
+                yield entry.path
+            else:
+                yield from _iter_pycache(entry.path)
+
+
+def _find_control_chars(content: str) -> List[tuple]:
+    """Return (line, col, code) for every disallowed control character in content."""
+    hits = []
+    line_no = 1
+    line_start = 0
+    last = 0
+    for match in _CONTROL_CHAR_RE.finditer(content):
+        pos = match.start()
+        newlines = content.count('\n', last, pos)
+        if newlines:
+            line_no += newlines
+            line_start = content.rfind('\n', last, pos) + 1
+        last = pos
+        hits.append((line_no, pos - line_start + 1, ord(match.group())))
+    return hits
+
+
+def _matching_lines(pattern, content: str) -> set:
+    """Return 1-based line numbers on which pattern matches in content."""
+    found = set()
+    line_no = 1
+    last = 0
+    for match in pattern.finditer(content):
+        pos = match.start()
+        line_no += content.count('\n', last, pos)
+        last = pos
+        found.add(line_no)
+    return found
+
+
+def _mismatched_brace_lines(content: str) -> set:
+    """Return line numbers whose unescaped { and } counts differ."""
+    mismatched = set()
+    line_no = 1
+    balance = 0
+    for match in _BRACE_TOKEN_RE.finditer(content):
+        token = match.group()
+        if token == '{':
+            balance += 1
+        elif token == '}':
+            balance -= 1
+        elif token == '\n':
+            if balance:
+                mismatched.add(line_no)
+            line_no += 1
+            balance = 0
+    if balance:
+        mismatched.add(line_no)
+    return mismatched
+
+
 def clean_build_artifacts(clean_all: bool = False) -> bool:
     """Clean LaTeX build artifacts and temporary files.
 
@@ -473,37 +664,64 @@ def clean_build_artifacts(clean_all: bool = False) -> bool:
 
     base_path = Path.cwd()
 
-    # Patterns to clean
-    patterns = [
-        '*.aux', '*.log', '*.out', '*.toc', '*.fdb_latexmk',
-        '*.fls', '*.synctex.gz', '*.bbl', '*.blg', '*.bcf',
-        '*.run.xml', '*.idx', '*.ilg', '*.ind', '*.lof',
-        '*.lot', '*.nav', '*.snm', '*.vrb', '*.xdv'
-    ]
-
-    # Add PDFs if doing full clean
-    if clean_all:
-        patterns.extend(['cv-*.pdf', '*.pdf'])
-
     files_removed = []
+    removals = []
 
     print_info("Searching for build artifacts...")
 
-    for pattern in patterns:
-        for file in base_path.glob(pattern):
-            try:
-                file.unlink()
-                files_removed.append(file.name)
-            except Exception as e:
-                print_warning(f"Could not remove {file.name}: {e}")
+    # Package files in the root that are symlinks or copies of texmf/ files
+    texmf_names = None
+    try:
+        with os.scandir(base_path / 'texmf') as it:
+            texmf_names = {e.name for e in it}
+        print_info("Cleaning symlinked package files...")
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    # All artifacts live in the project root, so a single directory pass covers them
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind('.')
+            suffix = name[dot:] if dot != -1 else ''
+            if (texmf_names is not None and suffix in TEXMF_SUFFIXES
+                    and (entry.is_symlink() or name in texmf_names)):
+                removals.append((name, os.unlink, entry.path))
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if (suffix in ARTIFACT_SUFFIXES
+                    or name.endswith(ARTIFACT_MULTIDOT_SUFFIXES)
+                    or (clean_all and suffix == '.pdf')):
+                removals.append((name, os.unlink, entry.path))
 
     # Clean __pycache__ directories
-    for pycache in base_path.rglob('__pycache__'):
-        try:
-            shutil.rmtree(pycache)
-            files_removed.append(str(pycache.relative_to(base_path)))
-        except Exception as e:
-            print_warning(f"Could not remove {pycache}: {e}")
+    for pycache in _iter_pycache(str(base_path)):
+        removals.append((os.path.relpath(pycache, base_path), shutil.rmtree, pycache))
+
+    # Per-document build directories kept by scripts/build.py
+    build_temp = base_path / '.build_temp'
+    if build_temp.is_dir():
+        removals.append(('.build_temp/', shutil.rmtree, str(build_temp)))
+
+    # PDFs cached by scripts/build.py; a clean build must run Tectonic again
+    pdf_cache = base_path / '.build_cache' / 'pdf'
+    if pdf_cache.is_dir():
+        removals.append(('.build_cache/pdf/', shutil.rmtree, str(pdf_cache)))
+
+    # Removal is syscall-bound, so let several threads wait on the filesystem
+    if removals:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(32, (os.cpu_count() or 1) * 4, len(removals))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(label, pool.submit(remove, path)) for label, remove, path in removals]
+        for label, future in futures:
+            try:
+                future.result()
+                files_removed.append(label)
+            except Exception as e:
+                print_warning(f"Could not remove {label}: {e}")
 
     # Clean output directory if doing full clean
     if clean_all:
@@ -519,20 +737,6 @@ def clean_build_artifacts(clean_all: bool = False) -> bool:
                 except Exception as e:
                     print_warning(f"Could not remove output directory: {e}")
 
-    # Clean symlinked package files in project root
-    texmf_dir = base_path / 'texmf'
-    if texmf_dir.exists():
-        print_info("Cleaning symlinked package files...")
-        for ext in ['*.sty', '*.cls', '*.def', '*.fd', '*.otf', '*.ttf', '*.pfb']:
-            for file in base_path.glob(ext):
-                # Check if it's a symlink or if the same file exists in texmf
-                if file.is_symlink() or (texmf_dir / file.name).exists():
-                    try:
-                        file.unlink()
-                        files_removed.append(file.name)
-                    except Exception as e:
-                        print_warning(f"Could not remove {file.name}: {e}")
-
     if files_removed:
         print_success(f"Removed {len(files_removed)} artifact(s):")
         for file in sorted(files_removed)[:10]:  # Show first 10
@@ -578,47 +782,49 @@ def validate_version(version: Optional[str] = None) -> bool:
         print(f"\n{Colors.BOLD}Checking {tex_file.name}:{Colors.ENDC}")
 
         try:
-            content = tex_file.read_text(encoding='utf-8')
+            content = tex_file.read_bytes().decode('utf-8')
         except UnicodeDecodeError:
             print_error("  ✗ File encoding error - not valid UTF-8")
             errors_found = True
             continue
+        if '\r' in content:
+            # Match read_text()'s universal newline handling
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
 
         file_errors = []
         file_warnings = []
 
         # Check for control characters (except newline, tab, carriage return)
-        for i, line in enumerate(content.split('\n'), 1):
-            for j, char in enumerate(line, 1):
-                if ord(char) < 32 and char not in '\t\r':
-                    file_errors.append(f"    Line {i}, col {j}: Control character (ASCII {ord(char)})")
+        for i, j, code in _find_control_chars(content):
+            file_errors.append(f"    Line {i}, col {j}: Control character (ASCII {code})")
 
         # Check for common LaTeX errors
+        brace_lines = _mismatched_brace_lines(content)
+        trailing_lines = _matching_lines(_TRAILING_WS_RE, content)
+        ended_envs = {m.group(1) for m in _END_RE.finditer(content)}
         lines = content.split('\n')
         for i, line in enumerate(lines, 1):
             # Unclosed braces (basic check)
-            open_braces = line.count('{') - line.count('\\{')
-            close_braces = line.count('}') - line.count('\\}')
-            if open_braces != close_braces:
+            if i in brace_lines:
                 file_warnings.append(f"    Line {i}: Mismatched braces (may be multi-line)")
 
             # Trailing whitespace
-            if line.endswith(' ') or line.endswith('\t'):
+            if i in trailing_lines:
                 file_warnings.append(f"    Line {i}: Trailing whitespace")
 
             # Template placeholders still present
-            if '[' in line and ']' in line:
-                placeholders = re.findall(r'\[[A-Z][^\]]*\]', line)
-                if placeholders:
-                    file_warnings.append(f"    Line {i}: Template placeholder found: {placeholders[0]}")
+            if '[' in line:
+                placeholder = _PLACEHOLDER_RE.search(line)
+                if placeholder:
+                    file_warnings.append(f"    Line {i}: Template placeholder found: {placeholder.group()}")
 
             # Common typos
             if '\\begin{' in line:
-                env_match = re.search(r'\\begin\{([^}]+)\}', line)
+                env_match = _BEGIN_RE.search(line)
                 if env_match:
                     env_name = env_match.group(1)
                     # Check if there's a matching \end
-                    if f'\\end{{{env_name}}}' not in content:
+                    if env_name not in ended_envs:
                         file_warnings.append(f"    Line {i}: \\begin{{{env_name}}} may be missing \\end{{{env_name}}}")
 
         # Display results for this file
@@ -669,36 +875,45 @@ def export_to_markdown(version: Optional[str] = None) -> bool:
     print_header(f"Export to Markdown: {version}")
 
     try:
-        # Run resume_to_markdown
+        import subprocess
+
+        # The two converters are independent, so launch them side by side
+        content_dir = Path.cwd() / '_content' / version
         print_info("Converting resume to markdown...")
-        result = subprocess.run(
-            [sys.executable, str(SCRIPTS_DIR / 'resume_to_markdown.py')],
-            capture_output=True,
+        resume_proc = subprocess.Popen(
+            [sys.executable, str(SCRIPTS_DIR / 'resume_to_markdown.py'), version],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True
         )
 
-        if result.returncode != 0:
-            print_error("Resume conversion failed")
-            if result.stderr:
-                print(result.stderr)
-            return False
-
-        print(result.stdout.strip())
-
-        # Check for cover letter
-        content_dir = Path.cwd() / '_content' / version
+        cover_proc = None
         if (content_dir / 'cover_letter.tex').exists():
             print_info("Converting cover letter to markdown...")
-            result = subprocess.run(
-                [sys.executable, str(SCRIPTS_DIR / 'cover_letter_to_markdown.py')],
-                capture_output=True,
+            cover_proc = subprocess.Popen(
+                [sys.executable, str(SCRIPTS_DIR / 'cover_letter_to_markdown.py'), version],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True
             )
 
-            if result.returncode != 0:
+        resume_out, resume_err = resume_proc.communicate()
+        if cover_proc is not None:
+            cover_out, _ = cover_proc.communicate()
+
+        if resume_proc.returncode != 0:
+            print_error("Resume conversion failed")
+            if resume_err:
+                print(resume_err)
+            return False
+
+        print(resume_out.strip())
+
+        if cover_proc is not None:
+            if cover_proc.returncode != 0:
                 print_warning("Cover letter conversion failed")
             else:
-                print(result.stdout.strip())
+                print(cover_out.strip())
 
         print_success("Markdown export complete!")
 
@@ -774,7 +989,9 @@ def duplicate_version(source: str, dest: Optional[str] = None) -> bool:
 
     # Copy
     try:
-        shutil.copytree(source_dir, dest_dir)
+        # Content only: timestamps/permissions of the source aren't needed
+        shutil.copytree(source_dir, dest_dir, copy_function=shutil.copyfile)
+        invalidate_caches()
         print_success(f"Created duplicate: {dest}")
 
         # Ask if user wants to switch to it
@@ -843,6 +1060,7 @@ def delete_version(version: str) -> bool:
     # Delete
     try:
         shutil.rmtree(version_dir)
+        invalidate_caches()
         print_success(f"Deleted version: {version}")
 
         # Also delete output directory if it exists
@@ -868,6 +1086,33 @@ def delete_version(version: str) -> bool:
         return False
 
 
+def _scandir_files(directory: Path, suffix: str) -> list:
+    """Return DirEntry objects for files in directory ending with suffix.
+
+    Returns an empty list if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [e for e in it if e.name.endswith(suffix) and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+@functools.lru_cache(maxsize=32)
+def _library_entry_count(lib_file: Path, mtime_ns: int, size: int) -> int:
+    """Count the top-level entries of a CV library JSON file.
+
+    mtime_ns and size only key the cache, so an unchanged library is not
+    parsed again each time the status screen is redrawn.
+    """
+    import json
+
+    # json.loads takes bytes directly (detecting UTF-8/16/32), which skips the
+    # text-mode wrapper and doesn't depend on the locale's default encoding
+    data = json.loads(lib_file.read_bytes())
+    return len(data) if isinstance(data, list) else len(data.keys())
+
+
 def show_status() -> None:
     """Show current pipeline status and information."""
     print_header("Resume Pipeline Status")
@@ -883,21 +1128,21 @@ def show_status() -> None:
 
     # Check for outputs
     output_dir = Path.cwd() / '_output' / current
-    if output_dir.exists():
-        pdfs = list(output_dir.glob('*.pdf'))
-        if pdfs:
-            print(f"\n{Colors.BOLD}Generated PDFs:{Colors.ENDC}")
-            for pdf in pdfs:
-                size_kb = pdf.stat().st_size / 1024
-                print(f"  - {pdf.name} ({size_kb:.1f} KB)")
+    pdfs = _scandir_files(output_dir, '.pdf')
+    if pdfs:
+        print(f"\n{Colors.BOLD}Generated PDFs:{Colors.ENDC}")
+        for pdf in pdfs:
+            size_kb = pdf.stat().st_size / 1024
+            print(f"  - {pdf.name} ({size_kb:.1f} KB)")
 
     # Version count
     print(f"\n{Colors.BOLD}Available Versions:{Colors.ENDC}")
     print(f"  Total: {len(versions)}")
 
-    complete = sum(1 for v in versions if get_version_status(v) == '[Complete]')
-    resume_ready = sum(1 for v in versions if get_version_status(v) == '[Resume Ready]')
-    partial = sum(1 for v in versions if get_version_status(v) == '[Partial]')
+    counts = Counter(get_version_status(v) for v in versions)
+    complete = counts['[Complete]']
+    resume_ready = counts['[Resume Ready]']
+    partial = counts['[Partial]']
 
     if complete:
         print(f"  {Colors.GREEN}Complete: {complete}{Colors.ENDC}")
@@ -907,28 +1152,116 @@ def show_status() -> None:
         print(f"  {Colors.YELLOW}Partial: {partial}{Colors.ENDC}")
 
     # Library info
-    library_dir = Path.cwd() / 'cv_library'
-    if library_dir.exists():
-        library_files = list(library_dir.glob('*.json'))
-        if library_files:
-            print(f"\n{Colors.BOLD}CV Library:{Colors.ENDC}")
-            for lib_file in library_files:
-                with open(lib_file, 'r') as f:
-                    data = json.load(f)
-                    count = len(data) if isinstance(data, list) else len(data.keys())
-                    print(f"  - {lib_file.name}: {count} entries")
+    library_files = _scandir_files(Path.cwd() / 'cv_library', '.json')
+    if library_files:
+        print(f"\n{Colors.BOLD}CV Library:{Colors.ENDC}")
+        for lib_file in library_files:
+            st = lib_file.stat()
+            count = _library_entry_count(Path(lib_file.path), st.st_mtime_ns, st.st_size)
+            print(f"  - {lib_file.name}: {count} entries")
+
+
+_MENU_WIDTH = 70
+_MENU_HEADER = (
+    f"{Colors.CYAN}╔{'═' * (_MENU_WIDTH - 2)}╗{Colors.ENDC}\n"
+    f"{Colors.CYAN}║{Colors.BOLD}{'Resume Pipeline Manager'.center(_MENU_WIDTH - 2)}{Colors.ENDC}{Colors.CYAN}║{Colors.ENDC}\n"  # noqa e501
+    f"{Colors.CYAN}╚{'═' * (_MENU_WIDTH - 2)}╝{Colors.ENDC}\n\n"
+)
+_MENU_OPTIONS = (
+    f"{Colors.CYAN}┌─ Version Management{Colors.ENDC}\n"
+    f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}1{Colors.ENDC} › Create new version\n"
+    f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}2{Colors.ENDC} › Switch version\n"
+    f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}3{Colors.ENDC} › Duplicate version\n"
+    f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}4{Colors.ENDC} › Delete version\n"
+    f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}5{Colors.ENDC} › List all versions\n"
+    f"\n{Colors.GREEN}┌─ Build & Validate{Colors.ENDC}\n"
+    f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}6{Colors.ENDC} › Build resume/cover letter\n"
+    f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}7{Colors.ENDC} › Validate current version\n"
+    f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}8{Colors.ENDC} › Export to markdown\n"
+    f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}9{Colors.ENDC} › Clean build artifacts\n"
+    f"\n{Colors.YELLOW}┌─ Tools{Colors.ENDC}\n"
+    f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}10{Colors.ENDC} › Refresh CV library (JSON)\n"
+    f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}11{Colors.ENDC} › Refresh VS Code tasks\n"
+    f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}12{Colors.ENDC} › Show status\n"
+    f"\n  {Colors.DIM}{Colors.BOLD}0{Colors.ENDC}{Colors.DIM} › Exit{Colors.ENDC}\n"
+)
+
+
+def _duplicate_from_menu() -> None:
+    """Menu option: pick a source version and duplicate it."""
+    versions = get_available_versions()
+    if not versions:
+        print_error("No versions available to duplicate")
+        return
+
+    print(f"\n{Colors.BOLD}Available versions:{Colors.ENDC}")
+    for i, v in enumerate(versions, 1):
+        print(f"  {i}. {v}")
+
+    try:
+        src_choice = input(f"\n{Colors.BOLD}Select source version (1-{len(versions)}): {Colors.ENDC}").strip()
+        src_idx = int(src_choice) - 1
+        if 0 <= src_idx < len(versions):
+            duplicate_version(versions[src_idx])
+        else:
+            print_error("Invalid selection")
+    except ValueError:
+        print_error("Invalid input")
+
+
+def _delete_from_menu() -> None:
+    """Menu option: pick a version and delete it."""
+    versions = get_available_versions()
+    if not versions:
+        print_error("No versions available to delete")
+        return
+
+    current_version = get_current_version()
+    print(f"\n{Colors.BOLD}Available versions:{Colors.ENDC}")
+    for i, v in enumerate(versions, 1):
+        current_marker = " ← current" if v == current_version else ""
+        print(f"  {i}. {v}{current_marker}")
+
+    try:
+        del_choice = input(f"\n{Colors.BOLD}Select version to delete (1-{len(versions)}): {Colors.ENDC}").strip()
+        if not del_choice:
+            print_info("Cancelled")
+            return
+        del_idx = int(del_choice) - 1
+        if 0 <= del_idx < len(versions):
+            delete_version(versions[del_idx])
+        else:
+            print_error("Invalid selection")
+    except ValueError:
+        print_error("Invalid input")
+
+
+_MENU_EXITS = frozenset(['0', '', 'q', 'quit', 'exit'])
+_MENU_ACTIONS = {
+    '1': create_new_version,
+    '2': select_version_interactive,
+    '3': _duplicate_from_menu,
+    '4': _delete_from_menu,
+    '5': list_versions,
+    '6': build_resume,
+    '7': validate_version,
+    '8': export_to_markdown,
+    '9': clean_build_artifacts,
+    '10': refresh_library,
+    '11': refresh_vscode_tasks,
+    '12': show_status,
+}
 
 
 def interactive_menu() -> None:
     """Show interactive menu and handle user selection."""
     while True:
-        clear_screen()
-
-        # Header with box drawing
-        width = 70
-        print(f"{Colors.CYAN}╔{'═' * (width - 2)}╗{Colors.ENDC}")
-        print(f"{Colors.CYAN}║{Colors.BOLD}{'Resume Pipeline Manager'.center(width - 2)}{Colors.ENDC}{Colors.CYAN}║{Colors.ENDC}")  # noqa e501
-        print(f"{Colors.CYAN}╚{'═' * (width - 2)}╝{Colors.ENDC}\n")
+        # Version data is cached by mtime, so redraws only rescan what changed
+        if _ansi_supported():
+            clear = _CLEAR_SEQUENCE  # Sent with the menu in the write below
+        else:
+            clear_screen()
+            clear = ''
 
         # Current version with better formatting
         current_version = get_current_version()
@@ -943,101 +1276,27 @@ def interactive_menu() -> None:
         else:
             status_colored = f"{Colors.YELLOW}{status}{Colors.ENDC}"
 
-        print(f"  {Colors.DIM}Current:{Colors.ENDC} {Colors.BOLD}{current_version}{Colors.ENDC} {status_colored}")
-        print(f"  {Colors.DIM}Total versions:{Colors.ENDC} {len(versions)}\n")
-
-        print(f"{Colors.CYAN}┌─ Version Management{Colors.ENDC}")
-        print(f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}1{Colors.ENDC} › Create new version")
-        print(f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}2{Colors.ENDC} › Switch version")
-        print(f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}3{Colors.ENDC} › Duplicate version")
-        print(f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}4{Colors.ENDC} › Delete version")
-        print(f"{Colors.CYAN}│{Colors.ENDC}  {Colors.BOLD}5{Colors.ENDC} › List all versions")
-
-        print(f"\n{Colors.GREEN}┌─ Build & Validate{Colors.ENDC}")
-        print(f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}6{Colors.ENDC} › Build resume/cover letter")
-        print(f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}7{Colors.ENDC} › Validate current version")
-        print(f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}8{Colors.ENDC} › Export to markdown")
-        print(f"{Colors.GREEN}│{Colors.ENDC}  {Colors.BOLD}9{Colors.ENDC} › Clean build artifacts")
-
-        print(f"\n{Colors.YELLOW}┌─ Tools{Colors.ENDC}")
-        print(f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}10{Colors.ENDC} › Refresh CV library (JSON)")
-        print(f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}11{Colors.ENDC} › Refresh VS Code tasks")
-        print(f"{Colors.YELLOW}│{Colors.ENDC} {Colors.BOLD}12{Colors.ENDC} › Show status")
-
-        print(f"\n  {Colors.DIM}{Colors.BOLD}0{Colors.ENDC}{Colors.DIM} › Exit{Colors.ENDC}")
+        # Only the current-version lines change between redraws; emit the
+        # whole screen with a single write
+        sys.stdout.write(
+            clear
+            + _MENU_HEADER
+            + f"  {Colors.DIM}Current:{Colors.ENDC} {Colors.BOLD}{current_version}{Colors.ENDC} {status_colored}\n"
+            + f"  {Colors.DIM}Total versions:{Colors.ENDC} {len(versions)}\n\n"
+            + _MENU_OPTIONS
+        )
+        sys.stdout.flush()
 
         choice = input(f"\n{Colors.BOLD}›{Colors.ENDC} ").strip().lower()
 
-        if choice == '0' or choice == '' or choice == 'q' or choice == 'quit' or choice == 'exit':
+        if choice in _MENU_EXITS:
             clear_screen()
             print(f"\n  {Colors.CYAN}Thanks for using Resume Pipeline!{Colors.ENDC}\n")
             break
-        elif choice == '1':
-            create_new_version()
-        elif choice == '2':
-            select_version_interactive()
-        elif choice == '3':
-            # Interactive duplicate - select source
-            versions = get_available_versions()
-            if not versions:
-                print_error("No versions available to duplicate")
-                continue
-
-            print(f"\n{Colors.BOLD}Available versions:{Colors.ENDC}")
-            for i, v in enumerate(versions, 1):
-                print(f"  {i}. {v}")
 
-            try:
-                src_choice = input(f"\n{Colors.BOLD}Select source version (1-{len(versions)}): {Colors.ENDC}").strip()
-                src_idx = int(src_choice) - 1
-                if 0 <= src_idx < len(versions):
-                    duplicate_version(versions[src_idx])
-                else:
-                    print_error("Invalid selection")
-            except ValueError:
-                print_error("Invalid input")
-
-        elif choice == '4':
-            # Interactive delete - select version
-            versions = get_available_versions()
-            if not versions:
-                print_error("No versions available to delete")
-                continue
-
-            print(f"\n{Colors.BOLD}Available versions:{Colors.ENDC}")
-            for i, v in enumerate(versions, 1):
-                current_marker = " ← current" if v == current_version else ""
-                print(f"  {i}. {v}{current_marker}")
-
-            try:
-                del_choice = input(f"\n{Colors.BOLD}Select version to delete (1-{len(versions)}): {Colors.ENDC}").strip()  # noqa e501
-                if not del_choice:
-                    print_info("Cancelled")
-                    continue
-                del_idx = int(del_choice) - 1
-                if 0 <= del_idx < len(versions):
-                    delete_version(versions[del_idx])
-                else:
-                    print_error("Invalid selection")
-            except ValueError:
-                print_error("Invalid input")
-
-        elif choice == '5':
-            list_versions()
-        elif choice == '6':
-            build_resume()
-        elif choice == '7':
-            validate_version()
-        elif choice == '8':
-            export_to_markdown()
-        elif choice == '9':
-            clean_build_artifacts()
-        elif choice == '10':
-            refresh_library()
-        elif choice == '11':
-            refresh_vscode_tasks()
-        elif choice == '12':
-            show_status()
+        action = _MENU_ACTIONS.get(choice)
+        if action is not None:
+            action()
         else:
             print_error("Invalid option")
 
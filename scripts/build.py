@@ -14,50 +14,169 @@ Usage:
     python scripts/build.py --cover-letter    # Build cover letter only
     python scripts/build.py --check           # Check if Tectonic is installed
     python scripts/build.py --skip-packages   # Skip automatic package check
+    python scripts/build.py --clean           # Discard kept build directories and cached PDFs, then rebuild
+    python scripts/build.py --force           # Rebuild even if outputs are up to date or cached
+    python scripts/build.py --cache-dir DIR   # Keep Tectonic's downloads in DIR (for CI caching)
 """
 
 import argparse
+import hashlib
+import json
+import shutil
 import subprocess
 import sys
 import os
+import re
 from pathlib import Path
 
 # Add scripts directory to path for cv_utils import
 sys.path.insert(0, str(Path(__file__).parent))
 from cv_utils import Colors, print_status, ProjectPaths  # noqa: E402
 
-# Import the package manager (will be imported after we cd to project root)
-PACKAGE_MANAGER_AVAILABLE = False
-PackageManager = None
+# Custom warnings raised by resume-pipeline.cls, matched against raw log lines
+WARNING_RE = re.compile(rb'Class resume-pipeline Warning: ([^\r\n]+)')
 
+# Per-project cache of results that are expensive to recompute between builds
+BUILD_CACHE_DIR = '.build_cache'
 
-def check_tectonic():
-    """Check if Tectonic is installed and accessible"""
+# Cached PDFs kept per document; older entries are pruned after each store
+PDF_CACHE_KEEP = 5
+
+# Per-document Tectonic output and logs, kept between builds
+BUILD_TEMP_DIR = '.build_temp'
+
+# Markdown converter module for each document type, imported on first use
+MARKDOWN_CONVERTERS = {
+    'resume': 'resume_to_markdown',
+    'coverletter': 'cover_letter_to_markdown',
+}
+
+# (doc_type, version) conversions queued by build_document(), run by run_markdown_hooks()
+PENDING_HOOKS = []
+
+# Tectonic executable; check_tectonic() replaces it with the path it resolved
+TECTONIC = 'tectonic'
+
+# `tectonic --version` output, set by check_tectonic(); part of the PDF cache key
+TECTONIC_VERSION = ''
+
+
+def publish_file(source, target):
+    """Move a built file into place, copying only when a rename isn't possible
+
+    The scratch directory is deleted after the build, so the file can be
+    moved rather than copied; a rename is a metadata-only operation.
+    """
     try:
-        result = subprocess.run(
-            ['tectonic', '--version'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version = result.stdout.strip()
-        print_status(f"Tectonic found: {version}", 'success')
-        return True
-    except FileNotFoundError:
+        os.replace(source, target)
+    except OSError:
+        # Different filesystem (or a target locked by a viewer on Windows);
+        # copyfile skips the metadata copy and uses the kernel fast path
+        shutil.copyfile(source, target)
+
+
+def check_tectonic(paths=None):
+    """Check if Tectonic is installed and accessible"""
+    global TECTONIC, TECTONIC_VERSION
+    if paths is None:
+        paths = ProjectPaths()
+
+    tectonic = shutil.which('tectonic')
+    if tectonic is None:
         print_status("Tectonic not found!", 'error')
         print("\nPlease install Tectonic:")
         print("  macOS:    brew install tectonic")
         print("  Windows:  Download from https://github.com/tectonic-typesetting/tectonic/releases")
         print("  Linux:    https://tectonic-typesetting.github.io/install.html")
         return False
-    except subprocess.CalledProcessError:
-        print_status("Error running Tectonic", 'error')
-        return False
 
+    # Reuse the version string from the last run unless the binary changed
+    st = os.stat(tectonic)
+    key = [tectonic, st.st_mtime_ns, st.st_size]
+    stamp = paths.base_dir / BUILD_CACHE_DIR / 'tectonic.json'
+    version = None
+    try:
+        cached = json.loads(stamp.read_text(encoding='utf-8'))
+        if cached.get('key') == key:
+            version = cached.get('version')
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if version is None:
+        try:
+            result = subprocess.run(
+                [tectonic, '--version'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            print_status("Error running Tectonic", 'error')
+            return False
+        version = result.stdout.strip()
+        try:
+            stamp.parent.mkdir(exist_ok=True)
+            stamp.write_text(json.dumps({'key': key, 'version': version}), encoding='utf-8')
+        except OSError:
+            pass  # Caching is best-effort
+
+    # Builds run the binary found here rather than searching PATH again
+    TECTONIC = tectonic
+    TECTONIC_VERSION = version
+    print_status(f"Tectonic found: {version}", 'success')
+    return True
+
+
+def package_signature(paths: ProjectPaths) -> str:
+    """Fingerprint the LaTeX sources and texmf/ by path, size and mtime
 
-def check_and_install_packages():
+    Covers the same .tex/.cls files the package scanner reads (it skips
+    build, _output, texmf and .git) plus the packages installed in texmf/.
+    """
+    skip_dirs = {'build', '_output', 'texmf', '.git'}
+    stats = []
+    for root, dirs, files in os.walk(paths.base_dir):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        for name in files:
+            if name.endswith(('.tex', '.cls')):
+                st = os.stat(os.path.join(root, name))
+                stats.append((os.path.relpath(os.path.join(root, name), paths.base_dir),
+                              st.st_size, st.st_mtime_ns))
+
+    try:
+        with os.scandir(paths.base_dir / 'texmf') as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    stats.append(('texmf/' + entry.name, st.st_size, st.st_mtime_ns))
+    except FileNotFoundError:
+        pass
+
+    digest = hashlib.blake2b(digest_size=16)
+    for item in sorted(stats):
+        digest.update(repr(item).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def check_and_install_packages(paths=None):
     """Check for missing LaTeX packages and install them automatically"""
-    if not PACKAGE_MANAGER_AVAILABLE or PackageManager is None:
+    if paths is None:
+        paths = ProjectPaths()
+
+    # Skip the scan when no source or installed package changed since it last passed
+    stamp = paths.base_dir / BUILD_CACHE_DIR / 'packages.sig'
+    try:
+        if stamp.read_text(encoding='utf-8') == package_signature(paths):
+            print_status("Package dependencies unchanged since last check", 'success')
+            return True
+    except OSError:
+        pass
+
+    # Imported only when a scan is needed: it pulls in urllib, tarfile and zipfile
+    try:
+        from latex_packages import PackageManager
+    except ImportError as e:
+        print_status(f"Package manager import failed: {e}", 'warning')
         print_status("Package manager not available, skipping package check", 'warning')
         return True
 
@@ -70,6 +189,12 @@ def check_and_install_packages():
 
         if success:
             print_status("All package dependencies satisfied", 'success')
+            try:
+                # Taken after the check, which may have installed into texmf/
+                stamp.parent.mkdir(exist_ok=True)
+                stamp.write_text(package_signature(paths), encoding='utf-8')
+            except OSError:
+                pass  # Caching is best-effort
         else:
             print_status("Some packages could not be installed", 'warning')
             print("Build may fail if missing packages are required")
@@ -96,6 +221,13 @@ def get_current_version(paths: ProjectPaths) -> str:
     return version
 
 
+def get_full_name(paths: ProjectPaths) -> str:
+    """Read the full name from cv-personal-details.tex"""
+    from cv_utils import extract_name_from_personal_details
+
+    return extract_name_from_personal_details(paths.personal_details_file)
+
+
 def check_version_content(version: str, paths: ProjectPaths) -> bool:
     """Check if version content directory exists"""
     if not version:
@@ -118,10 +250,151 @@ def check_version_content(version: str, paths: ProjectPaths) -> bool:
     return True
 
 
-def build_document(tex_file, output_name=None, paths=None):
-    """Build a LaTeX document using Tectonic"""
+def build_inputs(tex_path: Path, version: str, paths: ProjectPaths):
+    """List the directories and files a build of tex_path reads
+
+    Covers the document itself, the .tex/.cls files in the project root, the
+    AwesomeCV class, texmf/ and the version's content directory. Returns
+    (directories, files), with files sorted so callers see a stable order.
+    """
+    base = paths.base_dir
+    directories = []
+    inputs = {Path(tex_path).resolve()}
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(('.tex', '.cls')):
+                inputs.add(Path(entry.path).resolve())
+    for tree in (base / 'AwesomeCV', base / 'texmf', paths.version_dir(version)):
+        for root, dirs, files in os.walk(tree):
+            directories.append(root)
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                if not name.startswith('.'):
+                    inputs.add(Path(root, name).resolve())
+    return directories, sorted(inputs)
+
+
+def is_up_to_date(output: Path, directories, files, stamp: Path = None, engine: str = '') -> bool:
+    """Whether output is newer than every input file and input directory
+
+    Directory mtimes catch files removed from, or renamed within, a tree.
+    When stamp is given, it must also hold engine, the Tectonic version the
+    output was built with (see write_engine_stamp()).
+    """
+    try:
+        if stamp is not None and stamp.read_text(encoding='utf-8') != engine:
+            return False
+        built = output.stat().st_mtime_ns
+        return all(os.stat(path).st_mtime_ns <= built for path in (*directories, *files))
+    except OSError:
+        return False
+
+
+def write_engine_stamp(stamp: Path, engine: str):
+    """Record the Tectonic version a published PDF was built with (best-effort)"""
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(engine, encoding='utf-8')
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def compute_build_key(tex_path: Path, version: str, files, base_dir: Path,
+                      engine: str = '') -> str:
+    """Hash the content of every input file of a build
+
+    files comes from build_inputs(); it is sorted, so the key does not
+    depend on directory listing order. engine is the Tectonic version string,
+    so an upgraded engine does not reuse PDFs built by the old one.
+    """
+    # The document name is part of the key since every root .tex is an input
+    header = f'build-cache-2\0{engine}\0{Path(tex_path).name}\0{version}\0'
+    digest = hashlib.sha256(header.encode('utf-8'))
+    for path in files:
+        data = path.read_bytes()
+        digest.update(f'{os.path.relpath(path, base_dir)}\0{len(data)}\0'.encode('utf-8'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def restore_cached_build(cached_pdf: Path, pdf_path: Path, log_path: Path) -> bool:
+    """Copy a cached PDF and its log into the build directory, if present"""
+    try:
+        shutil.copyfile(cached_pdf, pdf_path)
+    except OSError:
+        return False
+    try:
+        shutil.copyfile(cached_pdf.with_suffix('.log'), log_path)
+    except OSError:
+        pass  # The log only carries content warnings
+    try:
+        # Mark the entry as recently used so prune_cached_builds() keeps it
+        os.utime(cached_pdf)
+    except OSError:
+        pass
+    return True
+
+
+def store_cached_build(pdf_path: Path, log_path: Path, cached_pdf: Path):
+    """Save a fresh build's PDF and log under its content key (best-effort)
+
+    Only the content-warning lines of the log are kept; they are all a
+    cached build reports, and the full Tectonic log runs to hundreds of KB.
+    """
+    try:
+        cached_pdf.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside each target and rename so a concurrent reader never
+        # sees a partial file; the PDF goes last as it marks the entry valid
+        cached_log = cached_pdf.with_suffix('.log')
+        partial = cached_log.with_name(cached_log.name + '.partial')
+        with open(partial, 'wb') as dst:
+            if log_path.exists():
+                with open(log_path, 'rb') as src:
+                    dst.writelines(line for line in src if WARNING_RE.search(line))
+        os.replace(partial, cached_log)
+
+        partial = cached_pdf.with_name(cached_pdf.name + '.partial')
+        shutil.copyfile(pdf_path, partial)
+        os.replace(partial, cached_pdf)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def prune_cached_builds(cache_dir: Path, stem: str, keep: int = PDF_CACHE_KEEP):
+    """Delete all but the keep most recently used cached PDFs of one document
+
+    Entries are named <stem>-<key>.pdf; each PDF's log goes with it.
+    """
+    prefix = stem + '-'
+    cached = []
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith('.pdf'):
+                    cached.append((entry.stat().st_mtime_ns, entry.path))
+    except OSError:
+        return
+    cached.sort(reverse=True)
+    for _, path in cached[keep:]:
+        for stale in (path, path[:-len('.pdf')] + '.log'):
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass  # Caching is best-effort
+
+
+def build_document(tex_file, output_name=None, paths=None, version=None, force=False):
+    """Build a LaTeX document using Tectonic
+
+    Unless force is set, a published PDF newer than every input and built by
+    the current Tectonic version is left as is; its markdown export is still
+    queued for run_markdown_hooks(). force also skips the PDF cache, so
+    Tectonic always runs.
+    """
     if paths is None:
         paths = ProjectPaths()
+    if version is None:
+        version = get_current_version(paths)
 
     tex_path = Path(tex_file)
     if not tex_path.exists():
@@ -131,102 +404,106 @@ def build_document(tex_file, output_name=None, paths=None):
     if output_name is None:
         output_name = tex_path.stem
 
-    print_status(f"Building {output_name}...", 'info')
+    doc_type = 'resume' if 'resume' in str(tex_path).lower() else 'coverletter'
+    doc_type_name = "Resume" if doc_type == 'resume' else "Cover Letter"
+    # Get full name from personal details for proper filename
+    final_pdf = paths.output_version_dir(version) / f"{get_full_name(paths)} {doc_type_name}.pdf"
+
+    input_dirs, input_files = build_inputs(tex_path, version, paths)
+    # A PDF built by another Tectonic version is out of date even if newer than its inputs
+    engine_stamp = paths.base_dir / BUILD_CACHE_DIR / 'published' / version / f"{tex_path.stem}.engine"
+    if not force and is_up_to_date(final_pdf, input_dirs, input_files, engine_stamp, TECTONIC_VERSION):
+        print_status(f"{output_name} is up to date: {final_pdf.relative_to(paths.base_dir)}", 'success')
+        # The markdown export is not checked here, so regenerate it in case it
+        # was deleted or is older than the PDF
+        PENDING_HOOKS.append((doc_type, version))
+        return True
 
-    # Create a temporary build directory to keep root clean
-    import shutil
+    print_status(f"Building {output_name}...", 'info')
 
-    build_dir = paths.base_dir / '.build_temp'
-    build_dir.mkdir(exist_ok=True)
+    # Build in .build_temp to keep root clean. Each document has its own directory,
+    # so documents can build concurrently; it is kept between runs rather than
+    # recreated (--clean discards it)
+    build_dir = paths.base_dir / BUILD_TEMP_DIR / tex_path.stem
+    build_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy necessary files to build directory
     texmf_dir = paths.base_dir / 'texmf'
     project_root = paths.base_dir
 
+    pdf_path = build_dir / tex_path.with_suffix('.pdf').name
+    log_path = build_dir / tex_path.with_suffix('.log').name
+    # A PDF left by an earlier run must not pass for this build's output
+    if pdf_path.exists():
+        pdf_path.unlink()
+
     try:
-        # Copy all required package files from texmf to build directory
-        if texmf_dir.exists():
-            for ext in ['*.sty', '*.cls', '*.def', '*.fd', '*.otf', '*.ttf', '*.pfb']:
-                for source_file in texmf_dir.glob(ext):
-                    target_file = build_dir / source_file.name
-                    shutil.copy2(source_file, target_file)
-
-        # Tectonic command with search path to find all project files
-        # Output goes to build directory, keeping workspace clean
-        subprocess.run(
-            [
-                'tectonic',
-                '--keep-logs',
-                '--keep-intermediates',
-                '--outdir', str(build_dir),
-                '-Z', f'search-path={project_root}',  # Search project root for inputs
-                '-Z', f'search-path={build_dir}',      # Search build dir for packages
-                str(tex_path)
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # Unchanged inputs reuse the PDF from an earlier build instead of rerunning Tectonic
+        cache_dir = paths.base_dir / BUILD_CACHE_DIR / 'pdf'
+        try:
+            key = compute_build_key(tex_path, version, input_files, paths.base_dir, TECTONIC_VERSION)
+            cached_pdf = cache_dir / f"{tex_path.stem}-{key}.pdf"
+        except OSError:
+            cached_pdf = None
+        from_cache = (not force and cached_pdf is not None
+                      and restore_cached_build(cached_pdf, pdf_path, log_path))
+
+        if not from_cache:
+            # Tectonic command with search path to find all project files.
+            # Packages and fonts are read from texmf/ in place rather than staged.
+            # Output goes to build directory, keeping workspace clean. Only the log
+            # is kept (it carries the content warnings); Tectonic does not read
+            # .aux/.toc intermediates back on the next run, so writing them is waste
+            subprocess.run(
+                [
+                    TECTONIC,
+                    '--keep-logs',
+                    '--outdir', str(build_dir),
+                    '-Z', f'search-path={project_root}',  # Search project root for inputs
+                    '-Z', f'search-path={texmf_dir}',      # Search texmf for packages
+                    str(tex_path)
+                ],
+                capture_output=True,
+                text=True,
+                check=True
+            )
 
         # Check if PDF was created in build directory
-        pdf_path = build_dir / tex_path.with_suffix('.pdf').name
         if pdf_path.exists():
+            if not from_cache and cached_pdf is not None:
+                store_cached_build(pdf_path, log_path, cached_pdf)
+                prune_cached_builds(cache_dir, tex_path.stem)
+
             size_kb = pdf_path.stat().st_size / 1024
-            print_status(f"Built {output_name}.pdf ({size_kb:.1f} KB)", 'success')
+            source = " (cached)" if from_cache else ""
+            print_status(f"Built {output_name}.pdf ({size_kb:.1f} KB){source}", 'success')
 
             # Parse LaTeX log for warnings (log is in build directory)
-            log_path = build_dir / tex_path.with_suffix('.log').name
             if log_path.exists():
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    log_content = f.read()
-                    # Look for our custom warnings
-                    import re
-                    warnings = re.findall(r'Class resume-pipeline Warning: (.+)', log_content)
-                    if warnings:
-                        print_status("Content warnings found:", 'warning')
-                        for warning in warnings:
-                            print(f"  • {warning}")
-
-            # Run post-build hook (copy PDF directly from build dir to output)
+                # Stream the log; only lines with our custom warnings are decoded
+                with open(log_path, 'rb') as f:
+                    warnings = []
+                    for line in f:
+                        match = WARNING_RE.search(line)
+                        if match:
+                            warnings.append(match.group(1).decode('utf-8', errors='ignore'))
+                if warnings:
+                    print_status("Content warnings found:", 'warning')
+                    for warning in warnings:
+                        print(f"  • {warning}")
+
+            # Run post-build hook (move PDF directly from build dir to output)
             try:
-                from cv_utils import extract_name_from_personal_details
-                version = get_current_version(paths)
-                doc_type = 'resume' if 'resume' in str(tex_path).lower() else 'coverletter'
-
-                # Copy PDF directly from build directory to output directory
+                # Move PDF directly from build directory to output directory
                 # This avoids the intermediate step of moving to project root
-                output_dir = paths.output_version_dir(version)
-                output_dir.mkdir(parents=True, exist_ok=True)
-
-                # Get full name from personal details for proper filename
-                full_name = extract_name_from_personal_details(paths.personal_details_file)
-                doc_type_name = "Resume" if doc_type == 'resume' else "Cover Letter"
-
-                final_pdf = output_dir / f"{full_name} {doc_type_name}.pdf"
-                shutil.copy2(pdf_path, final_pdf)
-                print_status(f"Copied to: {final_pdf.relative_to(paths.base_dir)}", 'success')
-
-                # Run markdown conversion
-                md_script = 'resume_to_markdown.py' if doc_type == 'resume' else 'cover_letter_to_markdown.py'
-                result = subprocess.run(
-                    ['python', f'scripts/{md_script}'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode == 0:
-                    print_status("Post-build hook completed", 'success')
-                else:
-                    print_status(f"Post-build hook warning: {result.stderr}", 'warning')
-            except Exception as e:
-                print_status(f"Post-build hook failed: {e}", 'warning')
+                final_pdf.parent.mkdir(parents=True, exist_ok=True)
+                publish_file(pdf_path, final_pdf)
+                write_engine_stamp(engine_stamp, TECTONIC_VERSION)
+                print_status(f"Saved to: {final_pdf.relative_to(paths.base_dir)}", 'success')
 
-            # Clean up build directory after successful build
-            try:
-                shutil.rmtree(build_dir)
+                # Queue markdown conversion; main() runs it once the builds finish
+                PENDING_HOOKS.append((doc_type, version))
             except Exception as e:
-                print_status(f"Warning: Could not clean build directory: {e}", 'warning')
+                print_status(f"Post-build hook failed: {e}", 'warning')
 
             return True
         else:
@@ -242,19 +519,36 @@ def build_document(tex_file, output_name=None, paths=None):
         if "Section" in e.stderr and "not found" in e.stderr:
             print("\n" + Colors.YELLOW + "Hint:" + Colors.RESET)
             print("  Missing section files. Make sure you've created content in:")
-            version = get_current_version(paths)
             if version:
                 print(f"  _content/{version}/")
 
         return False
 
-    finally:
-        # Clean up build directory on failure
-        if build_dir.exists():
-            try:
-                shutil.rmtree(build_dir)
-            except Exception:
-                pass  # Ignore cleanup errors
+
+def run_markdown_hooks():
+    """Run queued markdown conversions in-process and report their results
+
+    Calling the converters directly avoids starting a Python interpreter per
+    document; importlib keeps each converter loaded for later builds.
+    """
+    import contextlib
+    import importlib
+    import io
+
+    while PENDING_HOOKS:
+        doc_type, version = PENDING_HOOKS.pop(0)
+        output = io.StringIO()
+        try:
+            converter = importlib.import_module(MARKDOWN_CONVERTERS[doc_type])
+            # The converters report progress on stdout; keep the build summary quiet
+            with contextlib.redirect_stdout(output):
+                converter.main(version)
+        except SystemExit:
+            print_status(f"Post-build hook warning: {output.getvalue().strip()}", 'warning')
+        except Exception as e:
+            print_status(f"Post-build hook failed: {e}", 'warning')
+        else:
+            print_status("Post-build hook completed", 'success')
 
 
 def main():
@@ -282,44 +576,56 @@ def main():
         action='store_true',
         help='Skip automatic package dependency check'
     )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Remove the build directories kept in .build_temp and the cached PDFs, then rebuild (implies --force)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild with Tectonic even if the output PDFs are up to date or cached'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        metavar='DIR',
+        help='Directory for Tectonic\'s downloaded bundle cache (sets TECTONIC_CACHE_DIR); '
+             'point CI at a path it caches between runs, e.g. .tectonic_cache'
+    )
 
     args = parser.parse_args()
 
+    # Resolve before changing directory so a relative path means what the user typed
+    if args.cache_dir:
+        # Inherited by every tectonic process this script starts
+        os.environ['TECTONIC_CACHE_DIR'] = str(Path(args.cache_dir).resolve())
+
     # Change to project root if running from scripts/
     if Path.cwd().name == 'scripts':
         os.chdir('..')
 
-    # Import package manager after changing to project root
-    global PACKAGE_MANAGER_AVAILABLE, PackageManager
-    try:
-        # Add scripts directory to path
-        scripts_dir = Path.cwd() / 'scripts'
-        if str(scripts_dir) not in sys.path:
-            sys.path.insert(0, str(scripts_dir))
-
-        from latex_packages import PackageManager
-        PACKAGE_MANAGER_AVAILABLE = True
-    except ImportError as e:
-        print_status(f"Package manager import failed: {e}", 'warning')
-        PACKAGE_MANAGER_AVAILABLE = False
-
     print(f"\n{Colors.BOLD}Resume Build System{Colors.RESET}")
     print("=" * 50)
 
+    # Initialize project paths
+    paths = ProjectPaths()
+
     # Check Tectonic installation
-    if not check_tectonic():
+    if not check_tectonic(paths):
         sys.exit(1)
 
     # Check and install LaTeX packages (unless skipped)
     if not args.skip_packages:
-        check_and_install_packages()
+        check_and_install_packages(paths)
 
     if args.check:
         print_status("Tectonic is ready to use!", 'success')
         sys.exit(0)
 
-    # Initialize project paths
-    paths = ProjectPaths()
+    if args.clean:
+        shutil.rmtree(paths.base_dir / BUILD_TEMP_DIR, ignore_errors=True)
+        shutil.rmtree(paths.base_dir / BUILD_CACHE_DIR / 'pdf', ignore_errors=True)
+        print_status("Removed kept build directories and cached PDFs", 'info')
 
     # Check version and content
     version = get_current_version(paths)
@@ -333,7 +639,6 @@ def main():
     build_cover = args.cover_letter or not args.resume
 
     # Check if cover letter content exists
-    version = get_current_version(paths)
     cover_letter_exists = False
     if version:
         cover_letter_path = paths.version_dir(version) / 'cover_letter.tex'
@@ -344,15 +649,25 @@ def main():
         print_status(f"Skipping cover letter (no content found in _content/{version}/)", 'info')
         build_cover = False
 
-    success = True
-
+    jobs = []
     if build_resume:
-        if not build_document('cv-resume.tex', 'Resume', paths):
-            success = False
-
+        jobs.append(('cv-resume.tex', 'Resume'))
     if build_cover:
-        if not build_document('cv-coverletter.tex', 'Cover Letter', paths):
-            success = False
+        jobs.append(('cv-coverletter.tex', 'Cover Letter'))
+
+    # The documents don't depend on each other, so run both Tectonic builds at once
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        # --clean wipes the kept builds and cached PDFs, so it must rebuild too
+        futures = [pool.submit(build_document, tex_file, name, paths, version,
+                               args.force or args.clean)
+                   for tex_file, name in jobs]
+        results = [future.result() for future in futures]
+    success = all(results)
+
+    # Markdown exports for the documents that built
+    run_markdown_hooks()
 
     print("\n" + "=" * 50)
     if success:
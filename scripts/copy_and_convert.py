@@ -10,6 +10,7 @@ Usage:
     python copy_and_convert.py coverletter <jobname> <version>
 """
 
+import os
 import sys
 import time
 import shutil
@@ -27,6 +28,28 @@ from cv_utils import (  # noqa: E402
 )
 
 
+def pdf_is_complete(pdf_path: Path) -> bool:
+    """
+    Check whether a PDF has been written out completely.
+
+    A finished PDF ends with its %%EOF trailer, which the writer emits last.
+    A file that is missing or locked by the writer counts as incomplete.
+
+    Args:
+        pdf_path: Path to the PDF
+
+    Returns:
+        True if the file is readable and ends with the trailer
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 1024))
+            return b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
 def copy_pdf(
     doc_type: Literal['resume', 'coverletter'],
     jobname: str,
@@ -61,26 +84,18 @@ def copy_pdf(
     dest_filename = f"{full_name} {doc_type_name}.pdf"
     dest_pdf = output_dir / dest_filename
 
-    # Wait for PDF to be fully written (with retry logic)
-    max_retries = 10
-    retry_delay = 0.2  # 200ms between retries
-
-    for attempt in range(max_retries):
-        if source_pdf.exists():
-            # Extra delay to ensure file is completely written and closed
-            time.sleep(0.1)
-            try:
-                # Try to open the file to verify it's not locked
-                with open(source_pdf, 'rb') as f:
-                    f.read(1)
-                break  # File is accessible, proceed
-            except (IOError, PermissionError):
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                else:
-                    print_status(f"PDF may still be locked after {max_retries} attempts", 'warning')
-        else:
-            time.sleep(retry_delay)
+    # Wait for PDF to be fully written: it may still be open in LaTeX when this
+    # hook starts. Polls are cheap, so check often rather than sleeping long.
+    max_polls = 40
+    poll_interval = 0.05  # 50ms between checks, 2s in total
+
+    for attempt in range(max_polls):
+        if pdf_is_complete(source_pdf):
+            break
+        if attempt < max_polls - 1:
+            time.sleep(poll_interval)
+        elif source_pdf.exists():
+            print_status(f"PDF may still be locked or incomplete after {max_polls} checks", 'warning')
 
     if not source_pdf.exists():
         print_status(f"Source PDF not found: {source_pdf}", 'error')
@@ -89,9 +104,20 @@ def copy_pdf(
             f.write(f"Error: Source PDF not found: {source_pdf}\n")
         return False
 
+    # Move the file; within one filesystem this is a rename and copies no data
+    try:
+        os.replace(source_pdf, dest_pdf)
+        print_status(f"Moved: {dest_pdf}", 'success')
+        return True
+    except FileNotFoundError:
+        print_status(f"Source PDF not found: {source_pdf}", 'error')
+        return False
+    except OSError:
+        pass  # Different filesystem or a locked target; copy instead
+
     # Copy the file
     try:
-        shutil.copy2(source_pdf, dest_pdf)
+        shutil.copyfile(source_pdf, dest_pdf)
         print_status(f"Copied: {dest_pdf}", 'success')
 
         # Clean up source PDF from main directory
@@ -110,34 +136,32 @@ def copy_pdf(
         return False
 
 
-def run_markdown_conversion(doc_type: Literal['resume', 'coverletter'], paths: ProjectPaths) -> None:
+def run_markdown_conversion(
+    doc_type: Literal['resume', 'coverletter'],
+    paths: ProjectPaths,
+    version: str
+) -> None:
     """
     Run the appropriate markdown conversion script.
 
     Args:
         doc_type: Type of document ('resume' or 'coverletter')
         paths: ProjectPaths instance
+        version: Output version name, so the converter need not re-read cv-version.tex
     """
-    if doc_type == 'resume':
-        script = paths.scripts_dir / "resume_to_markdown.py"
-    else:
-        script = paths.scripts_dir / "cover_letter_to_markdown.py"
+    module_name = 'resume_to_markdown' if doc_type == 'resume' else 'cover_letter_to_markdown'
+    script = paths.scripts_dir / f"{module_name}.py"
 
     if not script.exists():
         print_status(f"Markdown conversion script not found: {script}", 'warning')
         return
 
     try:
-        # Import and run the conversion script
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("converter", script)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            # The script runs on import via if __name__ == '__main__'
-            # So we need to call main() directly if it exists
-            if hasattr(module, 'main'):
-                module.main()
+        # scripts/ is on sys.path, so the converter imports like any other module
+        # and stays loaded in sys.modules for later calls
+        import importlib
+        module = importlib.import_module(module_name)
+        module.main(version)
     except Exception as e:
         print_status(f"Markdown conversion failed: {e}", 'warning')
         # Don't exit - markdown is optional
@@ -161,15 +185,19 @@ def main() -> None:
     # Initialize project paths
     paths = ProjectPaths()
 
-    # Copy PDF with proper naming
-    success = copy_pdf(doc_type, jobname, version, paths)
+    # Copy the PDF and generate the markdown version side by side: the
+    # converter reads only the .tex sources, never the PDF being moved
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        copy_job = pool.submit(copy_pdf, doc_type, jobname, version, paths)
+        markdown_job = pool.submit(run_markdown_conversion, doc_type, paths, version)
+        success = copy_job.result()
+        markdown_job.result()
 
     if not success:
         handle_error(f"Failed to copy PDF for {doc_type}")
 
-    # Generate markdown version
-    run_markdown_conversion(doc_type, paths)
-
     print_status(f"Post-build complete for {doc_type}", 'success')
 
 
@@ -4,10 +4,11 @@ LaTeX Cover Letter to Markdown Converter
 Converts Your Name's LaTeX cover letter to clean Markdown format.
 """
 
+import io
 import re
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 # Add scripts directory to path for cv_utils import
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,6 +23,33 @@ from cv_utils import (  # noqa: E402
     ProjectPaths,
 )
 
+# Cover letter commands from cover_letter.tex, found in one pass; each
+# alternative ends in the group named after its field
+_LETTER_FIELD_RE = re.compile(
+    r'\\store(?:letterdate\{(?P<date>[^}]+)\}'
+    r'|recipient\{(?P<recipient_company>[^}]+)\}\{(?P<recipient_name>[^}]+)\}'
+    r'|lettertitle\{(?P<title>[^}]+)\}'
+    r'|letteropening\{(?P<opening>[^}]+)\}'
+    r'|letterclosing\{(?P<closing>[^}]+)\}'
+    r'|letterenclosure(?:\[(?P<enclosure_label>[^\]]+)\])?\{(?P<enclosure>[^}]+)\})'
+)
+# Comment-only lines are dropped along with their newline, so they never split
+# a paragraph; a "% " comment line is blanked like any other comment instead
+_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*%(?! [^\n]*\S)[^\n]*\n?', re.M)
+# Everything from an unescaped % to the end of its line. A % preceded by an even
+# run of backslashes (e.g. the \\ line break) is a comment; group 1 keeps the run
+_INLINE_COMMENT_RE = re.compile(r'(?<!\\)((?:\\\\)*)%[^\n]*')
+# Paragraphs are separated by blank (or whitespace-only) lines
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Contact line fields in display order, with the format for each value
+_CONTACT_FORMATS = (
+    ('email', '{}'),
+    ('mobile', '{}'),
+    ('homepage', '{}'),
+    ('linkedin', 'linkedin.com/in/{}'),
+)
+
 
 def extract_cover_letter_info(cover_letter_path: Path) -> Dict[str, str]:
     """Extract cover letter content from cover_letter.tex."""
@@ -29,37 +57,27 @@ def extract_cover_letter_info(cover_letter_path: Path) -> Dict[str, str]:
 
     info = {}
 
-    # Extract letter date
-    date_match = re.search(r'\\storeletterdate\{([^}]+)\}', content)
-    if date_match:
-        info['date'] = clean_latex_text(date_match.group(1), handle_today=True)
-
-    # Extract recipient
-    recipient_match = re.search(r'\\storerecipient\{([^}]+)\}\{([^}]+)\}', content)
-    if recipient_match:
-        info['recipient_company'] = clean_latex_text(recipient_match.group(1))
-        info['recipient_name'] = clean_latex_text(recipient_match.group(2))
-
-    # Extract title
-    title_match = re.search(r'\\storelettertitle\{([^}]+)\}', content)
-    if title_match:
-        info['title'] = clean_latex_text(title_match.group(1))
-
-    # Extract opening
-    opening_match = re.search(r'\\storeletteropening\{([^}]+)\}', content)
-    if opening_match:
-        info['opening'] = clean_latex_text(opening_match.group(1))
-
-    # Extract closing
-    closing_match = re.search(r'\\storeletterclosing\{([^}]+)\}', content)
-    if closing_match:
-        info['closing'] = clean_latex_text(closing_match.group(1))
-
-    # Extract enclosure
-    enclosure_match = re.search(r'\\storeletterenclosure(?:\[([^\]]+)\])?\{([^}]+)\}', content)
-    if enclosure_match:
-        info['enclosure_label'] = enclosure_match.group(1) if enclosure_match.group(1) else 'Enclosure'
-        info['enclosure'] = clean_latex_text(enclosure_match.group(2))
+    # The first occurrence of each command wins
+    fields = {}
+    for match in _LETTER_FIELD_RE.finditer(content):
+        fields.setdefault(match.lastgroup, match)
+
+    if 'date' in fields:
+        info['date'] = clean_latex_text(fields['date'].group('date'), handle_today=True)
+
+    if 'recipient_name' in fields:
+        recipient_match = fields['recipient_name']
+        info['recipient_company'] = clean_latex_text(recipient_match.group('recipient_company'))
+        info['recipient_name'] = clean_latex_text(recipient_match.group('recipient_name'))
+
+    for field in ('title', 'opening', 'closing'):
+        if field in fields:
+            info[field] = clean_latex_text(fields[field].group(field))
+
+    if 'enclosure' in fields:
+        enclosure_match = fields['enclosure']
+        info['enclosure_label'] = enclosure_match.group('enclosure_label') or 'Enclosure'
+        info['enclosure'] = clean_latex_text(enclosure_match.group('enclosure'))
 
     # Extract letter body - the content between \begin{storedcvletter}{ and }\end{storedcvletter}
     # Need to handle nested braces
@@ -68,41 +86,33 @@ def extract_cover_letter_info(cover_letter_path: Path) -> Dict[str, str]:
         # Find the position after the opening brace
         start_pos = body_start + len(r'\begin{storedcvletter}{')
 
-        # Find matching closing brace before \end{storedcvletter}
+        # Find matching closing brace before \end{storedcvletter}, jumping from
+        # brace to brace with str.find instead of stepping through every character
         brace_count = 1
         end_pos = start_pos
 
-        for i in range(start_pos, len(content)):
-            if content[i] == '{':
+        pos = start_pos
+        close_pos = content.find('}', pos)
+        while close_pos != -1:
+            open_pos = content.find('{', pos, close_pos)
+            if open_pos != -1:
                 brace_count += 1
-            elif content[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    end_pos = i
-                    break
-
-        body_text = content[start_pos:end_pos]
-
-        # Split into paragraphs (separated by blank lines)
-        paragraphs = []
-        current_para = []
-
-        for line in body_text.split('\n'):
-            # Skip comment-only lines
-            if line.strip().startswith('%') and not line.strip().startswith('% '):
+                pos = open_pos + 1
                 continue
-            # Remove inline comments but keep the text
-            line = re.sub(r'%.*$', '', line)
-            line = line.strip()
+            brace_count -= 1
+            if brace_count == 0:
+                end_pos = close_pos
+                break
+            pos = close_pos + 1
+            close_pos = content.find('}', pos)
 
-            if line:
-                current_para.append(line)
-            elif current_para:
-                paragraphs.append(' '.join(current_para))
-                current_para = []
+        body_text = content[start_pos:end_pos]
 
-        if current_para:
-            paragraphs.append(' '.join(current_para))
+        # Strip comments over the whole body, then split into paragraphs
+        # (separated by blank lines); clean_latex_text collapses the newlines
+        body_text = _COMMENT_LINE_RE.sub('', body_text)
+        body_text = _INLINE_COMMENT_RE.sub(r'\1', body_text)
+        paragraphs = _PARA_SPLIT_RE.split(body_text)
 
         # Clean each paragraph
         info['body_paragraphs'] = [clean_latex_text(p) for p in paragraphs if p.strip()]
@@ -120,76 +130,68 @@ def generate_markdown(base_path: Path, version: str) -> str:
     cv_path = base_path / '_content' / version
     cover_letter_info = extract_cover_letter_info(cv_path / 'cover_letter.tex')
 
-    # Build markdown
-    md_lines = []
+    # Build markdown in one buffer; every line is written with its newline
+    buf = io.StringIO()
+    name = personal_info.get('name', '')
 
     # Header with name and contact
-    md_lines.append(f"# {personal_info.get('name', '')}")
+    buf.write(f"# {name}\n")
 
     # Contact info
-    contact_parts = []
-    if 'email' in personal_info:
-        contact_parts.append(personal_info['email'])
-    if 'mobile' in personal_info:
-        contact_parts.append(personal_info['mobile'])
-    if 'homepage' in personal_info:
-        contact_parts.append(personal_info['homepage'])
-    if 'linkedin' in personal_info:
-        contact_parts.append(f"linkedin.com/in/{personal_info['linkedin']}")
-
-    md_lines.append(" | ".join(contact_parts))
-    md_lines.append("")
+    contact_parts = [fmt.format(personal_info[key])
+                     for key, fmt in _CONTACT_FORMATS if key in personal_info]
+
+    buf.write(" | ".join(contact_parts) + "\n\n")
 
     # Date
     if 'date' in cover_letter_info:
-        md_lines.append(cover_letter_info['date'])
-        md_lines.append("")
+        buf.write(cover_letter_info['date'] + "\n\n")
 
     # Recipient
     if 'recipient_company' in cover_letter_info:
-        md_lines.append(cover_letter_info['recipient_company'])
+        buf.write(cover_letter_info['recipient_company'] + "\n")
         if 'recipient_name' in cover_letter_info:
-            md_lines.append(cover_letter_info['recipient_name'])
-        md_lines.append("")
+            buf.write(cover_letter_info['recipient_name'] + "\n")
+        buf.write("\n")
 
     # Title (if present and different from default)
     if 'title' in cover_letter_info and cover_letter_info['title']:
-        md_lines.append(f"**Re: {cover_letter_info['title']}**")
-        md_lines.append("")
+        buf.write(f"**Re: {cover_letter_info['title']}**\n\n")
 
     # Opening
     if 'opening' in cover_letter_info:
-        md_lines.append(cover_letter_info['opening'])
-        md_lines.append("")
+        buf.write(cover_letter_info['opening'] + "\n\n")
 
     # Body paragraphs
     if 'body_paragraphs' in cover_letter_info:
         for para in cover_letter_info['body_paragraphs']:
-            md_lines.append(para)
-            md_lines.append("")
+            buf.write(para + "\n\n")
 
     # Closing
     if 'closing' in cover_letter_info:
-        md_lines.append(cover_letter_info['closing'])
-        md_lines.append("")
-        md_lines.append(personal_info.get('name', ''))
-        md_lines.append("")
+        buf.write(f"{cover_letter_info['closing']}\n\n{name}\n\n")
 
     # Enclosure
     if 'enclosure' in cover_letter_info:
         label = cover_letter_info.get('enclosure_label', 'Enclosure')
-        md_lines.append(f"*{label}: {cover_letter_info['enclosure']}*")
+        buf.write(f"*{label}: {cover_letter_info['enclosure']}*\n")
+
+    # The last line has never ended in a newline
+    return buf.getvalue()[:-1]
 
-    return "\n".join(md_lines)
 
+def main(version: Optional[str] = None) -> None:
+    """Main function to convert cover letter.
 
-def main() -> None:
-    """Main function to convert cover letter."""
+    Args:
+        version: Version to convert. If None, reads it from cv-version.tex.
+    """
     # Get project paths
     paths = ProjectPaths()
 
-    # Get current version
-    version = get_current_version(paths.version_file)
+    # Get current version unless the caller already knows it
+    if version is None:
+        version = get_current_version(paths.version_file)
     if not version:
         print("Error: Could not determine current version")
         sys.exit(1)
@@ -210,4 +212,4 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
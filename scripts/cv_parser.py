@@ -4,19 +4,84 @@ CV Parser - Extracts structured data from LaTeX CV files into JSON library
 Parses .tex files from cv/ subdirectories to build a searchable experience library
 """
 
+import os
 import re
 import json
 import sys
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Any, Set, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from collections import defaultdict
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from cv_utils.regex_parsing import normalize_company, normalize_dates  # noqa: E402
-from cv_utils.file_io import read_text_file_safe  # noqa: E402
+from cv_utils.file_io import read_binary_file, read_text_file  # noqa: E402
+
+# Patterns compiled once at import rather than looked up in re's cache per call
+# Template-hash normalization, applied to raw file bytes
+_SPACE_TAB_BYTES_RE = re.compile(rb'[ \t]+')
+_TRAILING_SPACE_BYTES_RE = re.compile(rb'[ \t\v\f\x1c-\x1f]+$', re.M)
+# What str.strip() removes within ASCII; bytes.strip() misses \x1c-\x1f
+_ASCII_WHITESPACE = b' \t\n\r\v\f\x1c\x1d\x1e\x1f'
+_TEXTBF_RE = re.compile(r'\\textbf\{([^}]*)\}')
+# Escaped characters and stray \end{cvitems}, replaced in a single pass
+_LATEX_ESCAPES = {r'\&': '&', r'\%': '%', r'\$': '$', r'\end{cvitems}': ''}
+_LATEX_ESCAPE_RE = re.compile('|'.join(map(re.escape, _LATEX_ESCAPES)))
+_WHITESPACE_RE = re.compile(r'\s+')
+# \cventry, optionally followed by '%' (authors sometimes use "\cventry%" to
+# comment the macro) and whitespace/newline
+_CVENTRY_RE = re.compile(r'\\cventry\s*%?\s*')
+# The five \cventry arguments, each allowing one level of nested braces; the
+# [^{}]*(?:\{[^{}]*\}[^{}]*)* form cannot backtrack catastrophically
+_CVENTRY_ARG = r'\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
+_CVENTRY_ARGS_RE = re.compile((r'[ \t\n]*' + _CVENTRY_ARG) * 5)
+_ITEM_RE = re.compile(r'\\item\s+(.*?)(?=\\item|\\end|$)', re.DOTALL)
+_CVSKILL_RE = re.compile(r'\\cvskill\s*\{([^}]*)\}\s*\{([^}]*)\}', re.DOTALL)
+_CVHONOR_RE = re.compile(r'\\cvhonor\s*\{([^}]*)\}\s*\{([^}]*)\}\s*\{([^}]*)\}\s*\{([^}]*)\}', re.DOTALL)
+# Ongoing roles, and the month and year a date range ends on
+_PRESENT_RE = re.compile(r'\b(?:present|current|now)\b', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(r'(?:\b([A-Za-z]{3})[A-Za-z]*\.?\s+)?(\d{4})\b')
+_MONTHS = {name: number for number, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1)}
+
+
+def _date_sort_key(dates: str) -> Tuple[int, str]:
+    """Sort key for a date range: its end as year * 100 + month, then the text.
+
+    Ongoing ranges sort after every dated one, a bare year counts as its
+    December, and ranges with no year at all sort first.
+    """
+    if _PRESENT_RE.search(dates):
+        return (999999, dates)
+    end = 0
+    for match in _MONTH_YEAR_RE.finditer(dates):
+        month = _MONTHS.get((match.group(1) or '').lower(), 12)
+        end = int(match.group(2)) * 100 + month
+    return (end, dates)
+
+
+def _dedupe(items: List[str]) -> List[str]:
+    """Drop repeats, keeping the first spelling of each.
+
+    Items that differ only in case or whitespace count as repeats, so a bullet
+    re-cased or re-wrapped in another version is not listed twice.
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        key = _WHITESPACE_RE.sub(' ', item).strip().casefold()
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+# Normalized-content hashes from earlier runs, keyed by path and validated
+# against each file's mtime and size; lives beside build.py's caches
+HASH_CACHE_FILE = Path('.build_cache') / 'cv_hashes.json'
+HASH_CACHE_FORMAT = 2
 
 
 class CVParser:
@@ -31,26 +96,94 @@ class CVParser:
         self.writing: List[Dict[str, Any]] = []  # Writing projects
         self.presentations: List[Dict[str, Any]] = []  # Presentations
         self.extracurricular: List[Dict[str, Any]] = []  # Extracurricular activities
-        self.template_hashes = self._load_template_hashes()
-
-    def _normalize_for_hash(self, content: str) -> str:
+        self._hash_cache_path = self.cv_base_path.parent / HASH_CACHE_FILE
+        self._hash_cache = self._load_hash_cache()
+        self._hash_cache_dirty = False
+        self._template_hashes: Optional[Set[str]] = None  # Hashed on first use
+
+    # Section files in parse order, with the parser method for each and the
+    # attribute its results go to
+    _SECTION_FILES = (
+        ('experience.tex', 'parse_experience_tex', 'jobs'),
+        ('skills.tex', 'parse_skills_tex', 'skills_by_job'),
+        ('education.tex', 'parse_cventries_generic_tex', 'education'),
+        ('certificates.tex', 'parse_cvhonors_tex', 'certificates'),
+        ('honors.tex', 'parse_cvhonors_tex', 'honors'),
+        ('committees.tex', 'parse_cvhonors_tex', 'committees'),
+        ('writing.tex', 'parse_cventries_generic_tex', 'writing'),
+        ('presentation.tex', 'parse_cventries_generic_tex', 'presentations'),
+        ('extracurricular.tex', 'parse_cventries_generic_tex', 'extracurricular'),
+    )
+
+    def _load_hash_cache(self) -> Dict[str, List[Any]]:
+        """Load file hashes saved by an earlier run, or nothing if unreadable"""
+        try:
+            cached = json.loads(self._hash_cache_path.read_text(encoding='utf-8'))
+            if cached.get('format') == HASH_CACHE_FORMAT:
+                return cached['files']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        return {}
+
+    def _save_hash_cache(self) -> None:
+        """Write the file hashes back if this run computed any new ones"""
+        if not self._hash_cache_dirty:
+            return
+        try:
+            self._hash_cache_path.parent.mkdir(exist_ok=True)
+            partial = self._hash_cache_path.with_name(self._hash_cache_path.name + '.partial')
+            partial.write_text(json.dumps({'format': HASH_CACHE_FORMAT, 'files': self._hash_cache}),
+                               encoding='utf-8')
+            os.replace(partial, self._hash_cache_path)
+            self._hash_cache_dirty = False
+        except OSError:
+            pass  # Caching is best-effort
+
+    def _normalize_for_hash(self, content: bytes) -> bytes:
         """Normalize content for consistent hashing (handles line endings, whitespace)"""
+        # Works on the raw bytes, so hashing never decodes and re-encodes the file
         # Normalize line endings to \n
-        normalized = content.replace('\r\n', '\n').replace('\r', '\n')
+        normalized = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
         # Normalize multiple spaces/tabs to single space
-        normalized = re.sub(r'[ \t]+', ' ', normalized)
+        normalized = _SPACE_TAB_BYTES_RE.sub(b' ', normalized)
         # Remove trailing whitespace from each line
-        normalized = '\n'.join(line.rstrip() for line in normalized.split('\n'))
+        normalized = _TRAILING_SPACE_BYTES_RE.sub(b'', normalized)
         # Remove leading/trailing whitespace from entire content
-        return normalized.strip()
+        return normalized.strip(_ASCII_WHITESPACE)
 
-    def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of normalized file content"""
-        if not file_path.exists():
-            return ""
-        content = file_path.read_text(encoding='utf-8')
-        normalized = self._normalize_for_hash(content)
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    def _compute_file_hash(self, file_path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Compute SHA256 hash of normalized file content
+
+        st may be passed in when the caller already has the file's stat.
+        """
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                return ""
+
+        # Reuse the hash from an earlier run while the file is unchanged
+        key = str(file_path)
+        cached = self._hash_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        normalized = self._normalize_for_hash(read_binary_file(file_path))
+        file_hash = hashlib.sha256(normalized).hexdigest()
+        self._hash_cache[key] = [st.st_mtime_ns, st.st_size, file_hash]
+        self._hash_cache_dirty = True
+        return file_hash
+
+    @property
+    def template_hashes(self) -> Set[str]:
+        """Hashes of all template files, loaded the first time a file is checked"""
+        if self._template_hashes is None:
+            self._template_hashes = self._load_template_hashes()
+        return self._template_hashes
+
+    @template_hashes.setter
+    def template_hashes(self, hashes: Set[str]) -> None:
+        self._template_hashes = hashes
 
     def _load_template_hashes(self) -> Set[str]:
         """Load hashes of all template files to exclude from parsing"""
@@ -67,12 +200,9 @@ class CVParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean LaTeX formatting from text"""
-        cleaned = re.sub(r'\\textbf\{([^}]*)\}', r'\1', text)
-        cleaned = re.sub(r'\\&', '&', cleaned)
-        cleaned = re.sub(r'\\%', '%', cleaned)
-        cleaned = re.sub(r'\\\$', '$', cleaned)
-        cleaned = re.sub(r'\\end\{cvitems\}', '', cleaned)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _TEXTBF_RE.sub(r'\1', text)
+        cleaned = _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_ESCAPES[m.group()], cleaned)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         return cleaned
 
     def _normalize_company(self, company: str) -> str:
@@ -83,64 +213,80 @@ class CVParser:
         """Normalize date formats for matching"""
         return normalize_dates(dates)
 
+    def _find_closing_brace(self, text: str, start_pos: int) -> int:
+        """Return the index of the brace closing the one at start_pos, or len(text)"""
+        # Jump from brace to brace with str.find rather than stepping through
+        # every character
+        brace_count = 1
+
+        pos = start_pos + 1
+        close_pos = text.find('}', pos)
+        while close_pos != -1:
+            open_pos = text.find('{', pos, close_pos)
+            if open_pos != -1:
+                brace_count += 1
+                pos = open_pos + 1
+                continue
+            brace_count -= 1
+            if brace_count == 0:
+                return close_pos
+            pos = close_pos + 1
+            close_pos = text.find('}', pos)
+
+        return len(text)
+
     def _extract_balanced_braces(self, text: str, start_pos: int) -> str:
         """Extract content within balanced braces starting at start_pos"""
         if start_pos >= len(text) or text[start_pos] != '{':
             return ""
 
-        brace_count = 0
-        result = ""
+        end_pos = self._find_closing_brace(text, start_pos)
+        # Nested braces are not part of the result
+        return text[start_pos + 1:end_pos].replace('{', '').replace('}', '')
 
-        for i in range(start_pos, len(text)):
-            char = text[i]
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return result
-            elif brace_count > 0:
-                result += char
+    def _extract_cventry_args(self, content: str, pos: int) -> List[str]:
+        """Extract up to 5 brace-delimited \\cventry arguments starting at pos"""
+        # Fast path: one regex match when no argument nests braces more than
+        # one level deep (e.g. \textbf{...} in a title, \item {...} in items)
+        match = _CVENTRY_ARGS_RE.match(content, pos)
+        if match:
+            return [arg.replace('{', '').replace('}', '').strip() for arg in match.groups()]
 
-        return result
+        args = []
+        for _ in range(5):
+            # Skip whitespace
+            while pos < len(content) and content[pos] in ' \t\n':
+                pos += 1
+
+            if pos >= len(content) or content[pos] != '{':
+                break
+
+            end_pos = self._find_closing_brace(content, pos)
+            # Nested braces are not part of the argument
+            args.append(content[pos + 1:end_pos].replace('{', '').replace('}', '').strip())
+
+            # Move past the closing brace
+            pos = end_pos + 1
+
+        return args
 
     def parse_experience_tex(self, content: str) -> List[Dict[str, Any]]:
         """Parse experience.tex file to extract job entries"""
         jobs = []
 
-        # Find all \cventry positions
-        # Pattern matches \cventry followed by an optional '%' (authors sometimes use
-        # "\cventry%" to comment the macro) and optional whitespace/newline.
-        # Accept both "\cventry" and "\cventry%" styles.
-        cventry_pattern = r'\\cventry\s*%?\s*'
-        matches = list(re.finditer(cventry_pattern, content))
+        # Find all \cventry positions, with or without a trailing '%'
+        matches = list(_CVENTRY_RE.finditer(content))
 
         for match in matches:
-            pos = match.end()
-
             # Extract 5 brace-delimited arguments
-            args = []
-            for _ in range(5):
-                # Skip whitespace
-                while pos < len(content) and content[pos] in ' \t\n':
-                    pos += 1
-
-                if pos >= len(content) or content[pos] != '{':
-                    break
-
-                arg = self._extract_balanced_braces(content, pos)
-                args.append(arg.strip())
-
-                # Move past the closing brace
-                pos += len(arg) + 2  # +2 for { and }
+            args = self._extract_cventry_args(content, match.end())
 
             if len(args) >= 5:
                 role, company, location, dates, items_block = args[:5]
 
                 # Extract bullet points
                 achievements = []
-                item_pattern = r'\\item\s+(.*?)(?=\\item|\\end|$)'
-                items = re.findall(item_pattern, items_block, re.DOTALL)
+                items = _ITEM_RE.findall(items_block)
 
                 for item in items:
                     cleaned = self._clean_text(item)
@@ -164,8 +310,7 @@ class CVParser:
         skills = {}
 
         # Match \cvskill entries
-        pattern = r'\\cvskill\s*\{([^}]*)\}\s*\{([^}]*)\}'
-        matches = re.finditer(pattern, content, re.DOTALL)
+        matches = _CVSKILL_RE.finditer(content)
 
         for match in matches:
             category = self._clean_text(match.group(1))
@@ -186,8 +331,7 @@ class CVParser:
         honors_list = []
 
         # Match \cvhonor entries
-        pattern = r'\\cvhonor\s*\{([^}]*)\}\s*\{([^}]*)\}\s*\{([^}]*)\}\s*\{([^}]*)\}'
-        matches = re.finditer(pattern, content, re.DOTALL)
+        matches = _CVHONOR_RE.finditer(content)
 
         for match in matches:
             name = self._clean_text(match.group(1))
@@ -216,31 +360,13 @@ class CVParser:
         """
         entries = []
 
-        # Find all \cventry positions
-        # Pattern matches \cventry followed by an optional '%' and optional whitespace/newline
-        # This mirrors the experience parser so generic entries are also detected when
-        # the macro is immediately followed by '%'.
-        cventry_pattern = r'\\cventry\s*%?\s*'
-        matches = list(re.finditer(cventry_pattern, content))
+        # Find all \cventry positions; shares the experience parser's pattern so
+        # generic entries are also detected when the macro is followed by '%'
+        matches = list(_CVENTRY_RE.finditer(content))
 
         for match in matches:
-            pos = match.end()
-
             # Extract 5 brace-delimited arguments
-            args = []
-            for _ in range(5):
-                # Skip whitespace
-                while pos < len(content) and content[pos] in ' \t\n':
-                    pos += 1
-
-                if pos >= len(content) or content[pos] != '{':
-                    break
-
-                arg = self._extract_balanced_braces(content, pos)
-                args.append(arg.strip())
-
-                # Move past the closing brace
-                pos += len(arg) + 2  # +2 for { and }
+            args = self._extract_cventry_args(content, match.end())
 
             if len(args) >= 5:
                 title, organization, location, dates, items_block = args[:5]
@@ -251,8 +377,7 @@ class CVParser:
 
                 # Extract bullet points
                 achievements = []
-                item_pattern = r'\\item\s+(.*?)(?=\\item|\\end|$)'
-                items = re.findall(item_pattern, items_block, re.DOTALL)
+                items = _ITEM_RE.findall(items_block)
 
                 for item in items:
                     cleaned = self._clean_text(item)
@@ -273,112 +398,45 @@ class CVParser:
 
     def parse_cv_directory(self, cv_dir: Path):
         """Parse all sections from a CV directory"""
-        # Parse experience.tex
-        exp_file = cv_dir / "experience.tex"
-        file_hash = self._compute_file_hash(exp_file)
-        if file_hash and file_hash not in self.template_hashes:
-            content = read_text_file_safe(exp_file)
-            if content:
-                jobs = self.parse_experience_tex(content)
-                self.jobs.extend(jobs)
-        elif file_hash:
-            print(f"  Skipping template file: {exp_file.relative_to(self.cv_base_path)}")
-
-        # Parse skills.tex
-        skills_file = cv_dir / "skills.tex"
-        if skills_file.exists():
-            file_hash = self._compute_file_hash(skills_file)
-            if file_hash not in self.template_hashes:
-                content = skills_file.read_text(encoding='utf-8')
-                skills = self.parse_skills_tex(content)
-                if skills:
-                    self.skills_by_job[cv_dir.name] = skills
-            else:
-                print(f"  Skipping template file: {skills_file.relative_to(self.cv_base_path)}")
-
-        # Parse education.tex
-        edu_file = cv_dir / "education.tex"
-        if edu_file.exists():
-            file_hash = self._compute_file_hash(edu_file)
-            if file_hash not in self.template_hashes:
-                content = edu_file.read_text(encoding='utf-8')
-                education = self.parse_cventries_generic_tex(content)
-                self.education.extend(education)
-            else:
-                print(f"  Skipping template file: {edu_file.relative_to(self.cv_base_path)}")
-
-        # Parse certificates.tex
-        cert_file = cv_dir / "certificates.tex"
-        if cert_file.exists():
-            file_hash = self._compute_file_hash(cert_file)
-            if file_hash not in self.template_hashes:
-                content = cert_file.read_text(encoding='utf-8')
-                certificates = self.parse_cvhonors_tex(content)
-                self.certificates.extend(certificates)
-            else:
-                print(f"  Skipping template file: {cert_file.relative_to(self.cv_base_path)}")
-
-        # Parse honors.tex
-        honors_file = cv_dir / "honors.tex"
-        if honors_file.exists():
-            file_hash = self._compute_file_hash(honors_file)
-            if file_hash not in self.template_hashes:
-                content = honors_file.read_text(encoding='utf-8')
-                honors = self.parse_cvhonors_tex(content)
-                self.honors.extend(honors)
-            else:
-                print(f"  Skipping template file: {honors_file.relative_to(self.cv_base_path)}")
-
-        # Parse committees.tex
-        committees_file = cv_dir / "committees.tex"
-        if committees_file.exists():
-            file_hash = self._compute_file_hash(committees_file)
-            if file_hash not in self.template_hashes:
-                content = committees_file.read_text(encoding='utf-8')
-                committees = self.parse_cvhonors_tex(content)
-                self.committees.extend(committees)
-            else:
-                print(f"  Skipping template file: {committees_file.relative_to(self.cv_base_path)}")
-
-        # Parse writing.tex
-        writing_file = cv_dir / "writing.tex"
-        if writing_file.exists():
-            file_hash = self._compute_file_hash(writing_file)
-            if file_hash not in self.template_hashes:
-                content = writing_file.read_text(encoding='utf-8')
-                writing = self.parse_cventries_generic_tex(content)
-                self.writing.extend(writing)
-            else:
-                print(f"  Skipping template file: {writing_file.relative_to(self.cv_base_path)}")
-
-        # Parse presentation.tex
-        pres_file = cv_dir / "presentation.tex"
-        if pres_file.exists():
-            file_hash = self._compute_file_hash(pres_file)
-            if file_hash not in self.template_hashes:
-                content = pres_file.read_text(encoding='utf-8')
-                presentations = self.parse_cventries_generic_tex(content)
-                self.presentations.extend(presentations)
-            else:
-                print(f"  Skipping template file: {pres_file.relative_to(self.cv_base_path)}")
-
-        # Parse extracurricular.tex
-        extra_file = cv_dir / "extracurricular.tex"
-        if extra_file.exists():
-            file_hash = self._compute_file_hash(extra_file)
-            if file_hash not in self.template_hashes:
-                content = extra_file.read_text(encoding='utf-8')
-                extracurricular = self.parse_cventries_generic_tex(content)
-                self.extracurricular.extend(extracurricular)
+        # One listing answers every "does this section exist" check, and each
+        # entry's stat is reused for the hash lookup
+        try:
+            with os.scandir(cv_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return
+
+        for file_name, parse, library in self._SECTION_FILES:
+            entry = entries.get(file_name)
+            if entry is None or not entry.is_file():
+                continue
+
+            section_file = cv_dir / file_name
+            file_hash = self._compute_file_hash(section_file, entry.stat())
+            if file_hash in self.template_hashes:
+                print(f"  Skipping template file: {section_file.relative_to(self.cv_base_path)}")
+                continue
+
+            content = read_text_file(section_file)
+            parsed = getattr(self, parse)(content)
+            if library == 'skills_by_job':
+                # Skills are kept per job context rather than pooled
+                if parsed:
+                    self.skills_by_job[cv_dir.name] = parsed
             else:
-                print(f"  Skipping template file: {extra_file.relative_to(self.cv_base_path)}")
+                getattr(self, library).extend(parsed)
 
     def parse_all_cvs(self):
         """Parse all CV directories"""
-        for cv_dir in self.cv_base_path.iterdir():
-            if cv_dir.is_dir() and not cv_dir.name.startswith('.') and not cv_dir.name.startswith('_'):
-                print(f"Parsing {cv_dir.name}...")
-                self.parse_cv_directory(cv_dir)
+        with os.scandir(self.cv_base_path) as it:
+            cv_dirs = [Path(entry.path) for entry in it
+                       if entry.is_dir() and not entry.name.startswith(('.', '_'))]
+
+        for cv_dir in cv_dirs:
+            print(f"Parsing {cv_dir.name}...")
+            self.parse_cv_directory(cv_dir)
+
+        self._save_hash_cache()
 
     def merge_jobs(self):
         """Merge jobs by company and overlapping years"""
@@ -411,13 +469,13 @@ class CVParser:
                         all_achievements.extend(job["achievements"])
 
                     # Deduplicate while preserving order
-                    base_job["titles"] = list(dict.fromkeys(all_titles))
-                    base_job["achievements"] = list(dict.fromkeys(all_achievements))
+                    base_job["titles"] = _dedupe(all_titles)
+                    base_job["achievements"] = _dedupe(all_achievements)
 
                     merged.append(base_job)
 
-        # Sort by date (most recent first)
-        self.jobs = sorted(merged, key=lambda x: x["dates"], reverse=True)
+        # Sort by end date (most recent first); each key is computed once
+        self.jobs = sorted(merged, key=lambda job: _date_sort_key(job["dates"]), reverse=True)
 
     def export_to_json(self, output_dir: Union[str, Path] = "./cv_library") -> None:
         """Export parsed data to JSON files"""
@@ -2,6 +2,7 @@
 
 from .regex_parsing import clean_latex_text, normalize_company, normalize_dates
 from .file_io import (
+    read_binary_file,
     read_text_file,
     write_text_file,
     read_text_file_safe,
@@ -30,6 +31,7 @@ __all__ = [
     'clean_latex_text',
     'normalize_company',
     'normalize_dates',
+    'read_binary_file',
     'read_text_file',
     'write_text_file',
     'read_text_file_safe',
@@ -36,12 +36,15 @@ def print_status(message: str, status: str = 'info') -> None:
         status: Status type ('success', 'error', 'warning', 'info')
     """
     if status == 'success':
-        print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
+        line = f"{Colors.GREEN}✓{Colors.RESET} {message}"
     elif status == 'error':
-        print(f"{Colors.RED}✗{Colors.RESET} {message}")
+        line = f"{Colors.RED}✗{Colors.RESET} {message}"
     elif status == 'warning':
-        print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
+        line = f"{Colors.YELLOW}⚠{Colors.RESET} {message}"
     elif status == 'info':
-        print(f"{Colors.BLUE}ℹ{Colors.RESET} {message}")
+        line = f"{Colors.BLUE}ℹ{Colors.RESET} {message}"
     else:
-        print(message)
+        line = message
+    # One write per line: print() sends the newline separately, which lets
+    # concurrent builds splice their status lines together
+    print(line + '\n', end='')
@@ -1,9 +1,40 @@
 """File I/O utilities for CV scripts."""
 
+import os
 from pathlib import Path
 from typing import Union, Optional
 
 
+def read_binary_file(file_path: Union[str, Path]) -> bytes:
+    """
+    Read a whole file as bytes, sized by a single fstat.
+
+    The LaTeX sources read here are a few KB, so one os.read usually returns
+    everything; this skips the seek/fstat calls a buffered open() makes.
+
+    Args:
+        file_path: Path to the file to read
+
+    Returns:
+        File content as bytes
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Ask for one byte more than the file size so a short read means EOF
+        # without another syscall; keep reading if the file grew meanwhile
+        bufsize = os.fstat(fd).st_size + 1
+        chunk = os.read(fd, bufsize)
+        if len(chunk) < bufsize:
+            return chunk
+        chunks = [chunk]
+        while chunk:
+            chunk = os.read(fd, 65536)
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
 def read_text_file(file_path: Union[str, Path]) -> str:
     """
     Read a text file with UTF-8 encoding.
@@ -12,10 +43,13 @@ def read_text_file(file_path: Union[str, Path]) -> str:
         file_path: Path to the file to read
 
     Returns:
-        File content as string
+        File content as string, with newlines normalized to \\n
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    text = read_binary_file(file_path).decode('utf-8')
+    # Match open()'s universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def write_text_file(file_path: Union[str, Path], content: str) -> None:
@@ -26,8 +60,18 @@ def write_text_file(file_path: Union[str, Path], content: str) -> None:
         file_path: Path to the file to write
         content: Content to write
     """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Match open()'s text mode, which writes os.linesep for each newline
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+    # Encode once and hand the bytes straight to the fd: for a few KB of
+    # markdown that is a single write() call
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def read_text_file_safe(file_path: Union[str, Path], default: str = "") -> str:
@@ -1,8 +1,16 @@
 """Regex parsing utilities for CV scripts."""
 
 
+import functools
 import re
 from datetime import date
+from typing import Optional
+
+# Patterns used by the company and date normalizers for every job entry
+_DASHES_RE = re.compile(r'\s*-{2,}\s*')
+_MINISTRY_RE = re.compile(r'\s+-\s+Ministry of the\s+', re.IGNORECASE)
+_PRESENT_RE = re.compile(r'Present', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 def clean_latex_text(text: str, *, convert_bold_italic=True, handle_today=False) -> str:
@@ -12,7 +20,14 @@ def clean_latex_text(text: str, *, convert_bold_italic=True, handle_today=False)
         convert_bold_italic: If True, convert \\textbf, \\textit, \\emph to markdown.
         handle_today: If True, replace \\today with current date.
     """
+    # The date is part of the cache key, so \today never returns a stale day
+    today = date.today().strftime('%B %d, %Y') if handle_today and '\\today' in text else None
+    return _clean_latex_text(text, convert_bold_italic, today)
+
 
+@functools.lru_cache(maxsize=2048)
+def _clean_latex_text(text: str, convert_bold_italic: bool, today: Optional[str]) -> str:
+    """Run the cleanup pipeline; repeated snippets (closings, labels) hit the cache."""
     # Replace escaped LaTeX special characters with their literal equivalents before any other processing
     # Use a placeholder for escaped percent to preserve it through comment removal
     PERCENT_PLACEHOLDER = '<<PERCENT_SIGN_PLACEHOLDER>>'
@@ -63,8 +78,8 @@ def clean_latex_text(text: str, *, convert_bold_italic=True, handle_today=False)
     # Remove any leftover empty braces
     text = re.sub(r'\{\}', '', text)
 
-    if handle_today:
-        text = re.sub(r'\\today', date.today().strftime('%B %d, %Y'), text)
+    if today is not None:
+        text = text.replace('\\today', today)
 
     # Clean up whitespace (including multiple spaces and spaces around dots)
     text = re.sub(r'\s+', ' ', text)
@@ -75,14 +90,14 @@ def clean_latex_text(text: str, *, convert_bold_italic=True, handle_today=False)
 
 def normalize_company(company: str) -> str:
     """Normalize company names for matching."""
-    normalized = re.sub(r'\s*-{2,}\s*', ' - ', company)
-    normalized = re.sub(r'\s+-\s+Ministry of the\s+', ' - ', normalized, flags=re.IGNORECASE)
+    normalized = _DASHES_RE.sub(' - ', company)
+    normalized = _MINISTRY_RE.sub(' - ', normalized)
     return normalized.strip()
 
 
 def normalize_dates(dates: str, present_year='2024') -> str:
     """Normalize date formats for matching."""
-    normalized = re.sub(r'\s*-{2,}\s*', ' - ', dates)
-    normalized = re.sub(r'Present', present_year, normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\s+', '', normalized)
+    normalized = _DASHES_RE.sub(' - ', dates)
+    normalized = _PRESENT_RE.sub(present_year, normalized)
+    normalized = _WHITESPACE_RE.sub('', normalized)
     return normalized
@@ -1,9 +1,25 @@
 """CV version management utilities."""
 
+import functools
+import os
 import re
 from pathlib import Path
 from typing import Tuple, Optional, Dict
 from .console import Colors
+from .file_io import read_binary_file, read_text_file
+
+# \newcommand{\OutputVersion}{version_name} in cv-version.tex, matched on raw bytes
+_VERSION_RE = re.compile(rb'\\newcommand\{\\OutputVersion\}\s*\{([^}\r\n]+)\}')
+# Name and contact details in cv-personal-details.tex, found in one pass;
+# each alternative ends in the group named after its field
+_PERSONAL_FIELD_RE = re.compile(
+    r'\\(?:name\{(?P<first_name>[^}]+)\}\{(?P<name>[^}]+)\}'
+    r'|mobile\{[^}]+\}\{(?P<mobile>[^}]+)\}'
+    r'|email\{(?P<email>[^}]+)\}'
+    r'|homepage\{(?P<homepage>[^}]+)\}'
+    r'|github\{(?P<github>[^}]+)\}'
+    r'|linkedin\{(?P<linkedin>[^}]+)\})'
+)
 
 
 def get_current_version(version_file: Path) -> Optional[str]:
@@ -16,21 +32,15 @@ def get_current_version(version_file: Path) -> Optional[str]:
     Returns:
         Version name, or None if not found
     """
-    if not version_file.exists():
+    try:
+        content = read_binary_file(version_file)
+    except FileNotFoundError:
         return None
 
-    content = version_file.read_text(encoding='utf-8')
-
-    # Extract version from \newcommand{\OutputVersion}{version_name}
-    for line in content.split('\n'):
-        if '\\newcommand{\\OutputVersion}' in line:
-            # Extract content between braces
-            start = line.find('{', line.find('\\OutputVersion')) + 1
-            end = line.find('}', start)
-            if start > 0 and end > start:
-                return line[start:end]
-
-    return None
+    # Extract version from \newcommand{\OutputVersion}{version_name}; only the
+    # name itself is decoded
+    match = _VERSION_RE.search(content)
+    return match.group(1).decode('utf-8') if match else None
 
 
 def get_version_status(version_dir: Path) -> Tuple[str, str]:
@@ -96,21 +106,9 @@ def extract_name_from_personal_details(personal_details_path: Path) -> str:
     Returns:
         Full name in format "FirstName LastName", or "CV" as fallback
     """
-    try:
-        content = personal_details_path.read_text(encoding='utf-8')
-
-        # Look for \name{First}{Last}
-        name_match = re.search(r'\\name\{([^}]+)\}\{([^}]+)\}', content)
-
-        if name_match:
-            first_name = name_match.group(1).strip()
-            last_name = name_match.group(2).strip()
-            return f"{first_name} {last_name}"
-
-        # Fallback
-        return "CV"
-    except Exception:
-        return "CV"
+    # The name comes out of the same single scan (and cache) as the contact
+    # details, so the file is not searched a second time just for \name
+    return extract_personal_info(personal_details_path).get('name') or "CV"
 
 
 def extract_personal_info(personal_details_path: Path) -> Dict[str, str]:
@@ -124,36 +122,30 @@ def extract_personal_info(personal_details_path: Path) -> Dict[str, str]:
         Dictionary with personal info fields (name, mobile, email, homepage, github, linkedin)
     """
     try:
-        content = personal_details_path.read_text(encoding='utf-8')
-    except Exception:
+        st = os.stat(personal_details_path)
+    except OSError:
         return {}
+    # The cache holds an immutable tuple; every caller gets its own dict
+    return dict(_read_personal_info(str(personal_details_path), st.st_mtime_ns, st.st_size))
 
-    info = {}
-
-    # Extract name
-    name_match = re.search(r'\\name\{([^}]+)\}\{([^}]+)\}', content)
-    if name_match:
-        info['name'] = f"{name_match.group(1).strip()} {name_match.group(2).strip()}"
-
-    # Extract contact details
-    mobile_match = re.search(r'\\mobile\{[^}]+\}\{([^}]+)\}', content)
-    if mobile_match:
-        info['mobile'] = mobile_match.group(1).strip()
-
-    email_match = re.search(r'\\email\{([^}]+)\}', content)
-    if email_match:
-        info['email'] = email_match.group(1).strip()
-
-    homepage_match = re.search(r'\\homepage\{([^}]+)\}', content)
-    if homepage_match:
-        info['homepage'] = homepage_match.group(1).strip()
 
-    github_match = re.search(r'\\github\{([^}]+)\}', content)
-    if github_match:
-        info['github'] = github_match.group(1).strip()
-
-    linkedin_match = re.search(r'\\linkedin\{([^}]+)\}', content)
-    if linkedin_match:
-        info['linkedin'] = linkedin_match.group(1).strip()
+@functools.lru_cache(maxsize=8)
+def _read_personal_info(personal_details_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse the personal info fields; mtime_ns and size only key the cache."""
+    try:
+        content = read_text_file(personal_details_path)
+    except Exception:
+        return ()
 
-    return info
+    info = {}
+    for match in _PERSONAL_FIELD_RE.finditer(content):
+        field = match.lastgroup
+        # The first definition of a field wins
+        if field in info:
+            continue
+        if field == 'name':
+            info['name'] = f"{match.group('first_name').strip()} {match.group('name').strip()}"
+        else:
+            info[field] = match.group(field).strip()
+
+    return tuple(info.items())
@@ -129,8 +129,8 @@ def main() -> None:
     # Write to file
     tasks_file = paths.vscode_dir / "tasks.json"
     try:
-        with open(tasks_file, 'w', encoding='utf-8') as f:
-            json.dump(tasks_data, f, indent=4, ensure_ascii=False)
+        # Serialize in one call and write once rather than streaming small chunks
+        tasks_file.write_text(json.dumps(tasks_data, indent=4, ensure_ascii=False), encoding='utf-8')
 
         print_status(f"Generated {tasks_file}", 'success')
         if versions:
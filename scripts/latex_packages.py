@@ -14,6 +14,7 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import shutil
 import subprocess
@@ -30,6 +31,9 @@ from typing import Set, Dict, Optional, List
 sys.path.insert(0, str(Path(__file__).parent))
 from cv_utils import Colors, print_status
 
+# Package and font files copied out of downloaded archives
+PACKAGE_FILE_SUFFIXES = ('.sty', '.cls', '.def', '.fd', '.otf', '.ttf', '.pfb')
+
 
 class DependencyScanner:
     """Scans LaTeX files for package dependencies"""
@@ -266,13 +270,14 @@ class CTANDownloader:
             # Find and copy relevant files
             files_copied = 0
 
-            # Look for .sty, .cls, .def, .fd, .otf, .ttf files
-            for ext in ['*.sty', '*.cls', '*.def', '*.fd', '*.otf', '*.ttf', '*.pfb']:
-                for file_path in temp_path.rglob(ext):
-                    # Copy to texmf root (flatten structure for simplicity)
-                    dest = self.texmf_dir / file_path.name
-                    shutil.copy2(file_path, dest)
-                    files_copied += 1
+            # Look for .sty, .cls, .def, .fd, .otf, .ttf files in one walk of the archive
+            for root, _dirs, files in os.walk(temp_path):
+                for name in files:
+                    if name.endswith(PACKAGE_FILE_SUFFIXES):
+                        # Move to texmf root (flatten structure for simplicity); the
+                        # temp directory is discarded, so a rename beats a byte copy
+                        shutil.move(os.path.join(root, name), str(self.texmf_dir / name))
+                        files_copied += 1
 
             return files_copied > 0
 
@@ -7,7 +7,7 @@ Converts Your Name's LaTeX resume to clean Markdown format.
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Add scripts directory to path for cv_utils import
 sys.path.insert(0, str(Path(__file__).parent))
@@ -23,6 +23,15 @@ from cv_utils import (  # noqa: E402
     ProjectPaths,
 )
 
+# Contact line fields in display order, with the format for each value
+_CONTACT_FORMATS = (
+    ('email', '📧 {}'),
+    ('mobile', '📱 {}'),
+    ('homepage', '🌐 {}'),
+    ('github', '💻 github.com/{}'),
+    ('linkedin', '💼 linkedin.com/in/{}'),
+)
+
 
 def extract_tagline(tagline_path: Path) -> str:
     """Extract position/tagline from tagline.tex."""
@@ -363,17 +372,8 @@ def generate_markdown(base_path: Path, version: str) -> str:
         md_lines.append(f"\n*{tagline}*\n")
 
     # Contact info
-    contact_parts = []
-    if 'email' in personal_info:
-        contact_parts.append(f"📧 {personal_info['email']}")
-    if 'mobile' in personal_info:
-        contact_parts.append(f"📱 {personal_info['mobile']}")
-    if 'homepage' in personal_info:
-        contact_parts.append(f"🌐 {personal_info['homepage']}")
-    if 'github' in personal_info:
-        contact_parts.append(f"💻 github.com/{personal_info['github']}")
-    if 'linkedin' in personal_info:
-        contact_parts.append(f"💼 linkedin.com/in/{personal_info['linkedin']}")
+    contact_parts = [fmt.format(personal_info[key])
+                     for key, fmt in _CONTACT_FORMATS if key in personal_info]
 
     md_lines.append(" | ".join(contact_parts))
     md_lines.append("")
@@ -455,13 +455,18 @@ def generate_markdown(base_path: Path, version: str) -> str:
     return "\n".join(md_lines)
 
 
-def main() -> None:
-    """Main function to convert resume."""
+def main(version: Optional[str] = None) -> None:
+    """Main function to convert resume.
+
+    Args:
+        version: Version to convert. If None, reads it from cv-version.tex.
+    """
     # Initialize project paths
     paths = ProjectPaths()
 
-    # Get current version
-    version = get_current_version(paths.version_file)
+    # Get current version unless the caller already knows it
+    if version is None:
+        version = get_current_version(paths.version_file)
 
     if not version:
         print("Error: Could not find OutputVersion in cv-version.tex")
@@ -484,4 +489,4 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Tests for build.py's incremental build and PDF cache helpers
+"""
+
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from build import (
+    build_inputs, compute_build_key, is_up_to_date, prune_cached_builds,
+    restore_cached_build,
+)
+from cv_utils import ProjectPaths
+
+
+def set_mtime(path, seconds):
+    """Set a path's access and modification times to seconds since the epoch"""
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a minimal project tree with one content version."""
+    (tmp_path / "cv-resume.tex").write_text("resume")
+    (tmp_path / "cv-version.tex").write_text("version")
+    (tmp_path / "resume-pipeline.cls").write_text("class")
+    (tmp_path / "notes.txt").write_text("not an input")
+    (tmp_path / "AwesomeCV").mkdir()
+    (tmp_path / "AwesomeCV" / "awesome-cv.cls").write_text("awesome")
+    (tmp_path / "texmf").mkdir()
+    (tmp_path / "texmf" / "fontawesome.sty").write_text("sty")
+    content = tmp_path / "_content" / "v1"
+    content.mkdir(parents=True)
+    (content / "experience.tex").write_text("experience")
+    (content / ".hidden.tex").write_text("hidden")
+    (content / ".git").mkdir()
+    (content / ".git" / "HEAD").write_text("ref")
+    (tmp_path / "_content" / "v2").mkdir()
+    (tmp_path / "_content" / "v2" / "skills.tex").write_text("other version")
+    return ProjectPaths(tmp_path)
+
+
+class TestBuildInputs:
+    """Test the input listing used by the up-to-date check and cache key."""
+
+    def test_lists_document_root_sources_and_version_trees(self, project):
+        """Test that the build's own sources are listed, sorted."""
+        base = project.base_dir
+        directories, files = build_inputs(base / "cv-resume.tex", "v1", project)
+
+        assert files == sorted(files)
+        assert set(files) == {
+            base / "cv-resume.tex",
+            base / "cv-version.tex",
+            base / "resume-pipeline.cls",
+            base / "AwesomeCV" / "awesome-cv.cls",
+            base / "texmf" / "fontawesome.sty",
+            base / "_content" / "v1" / "experience.tex",
+        }
+        assert str(base / "_content" / "v1") in directories
+        assert str(base / "texmf") in directories
+
+    def test_skips_hidden_files_and_other_versions(self, project):
+        """Test that hidden entries and other versions' content are not inputs."""
+        _, files = build_inputs(project.base_dir / "cv-resume.tex", "v1", project)
+        names = {path.name for path in files}
+
+        assert ".hidden.tex" not in names
+        assert "HEAD" not in names
+        assert "skills.tex" not in names
+        assert "notes.txt" not in names
+
+
+class TestIsUpToDate:
+    """Test the mtime and engine-version check against a published PDF."""
+
+    @pytest.fixture
+    def built(self, project):
+        """Publish a PDF newer than every input of the v1 resume build."""
+        base = project.base_dir
+        directories, files = build_inputs(base / "cv-resume.tex", "v1", project)
+        for path in (*directories, *files):
+            set_mtime(path, 1000)
+        output = base / "_output" / "resume.pdf"
+        output.parent.mkdir()
+        output.write_bytes(b"%PDF")
+        set_mtime(output, 2000)
+        stamp = base / "resume.engine"
+        stamp.write_text("Tectonic 0.15.0")
+        return output, directories, files, stamp
+
+    def test_output_newer_than_inputs(self, built):
+        """Test that an output newer than every input is up to date."""
+        output, directories, files, _ = built
+        assert is_up_to_date(output, directories, files)
+
+    def test_input_file_changed(self, built, project):
+        """Test that an input modified after the output is not up to date."""
+        output, directories, files, _ = built
+        set_mtime(project.version_dir("v1") / "experience.tex", 3000)
+        assert not is_up_to_date(output, directories, files)
+
+    def test_input_directory_changed(self, built, project):
+        """Test that a file removed from an input tree makes the output stale."""
+        output, directories, files, _ = built
+        set_mtime(project.version_dir("v1"), 3000)
+        assert not is_up_to_date(output, directories, files)
+
+    def test_missing_output(self, built):
+        """Test that a missing output is never up to date."""
+        output, directories, files, _ = built
+        output.unlink()
+        assert not is_up_to_date(output, directories, files)
+
+    def test_engine_stamp_matches(self, built):
+        """Test that an output built by the current Tectonic is up to date."""
+        output, directories, files, stamp = built
+        assert is_up_to_date(output, directories, files, stamp, "Tectonic 0.15.0")
+
+    def test_engine_stamp_differs(self, built):
+        """Test that an output built by another Tectonic version is stale."""
+        output, directories, files, stamp = built
+        assert not is_up_to_date(output, directories, files, stamp, "Tectonic 0.16.0")
+
+    def test_engine_stamp_missing(self, built):
+        """Test that an output with no recorded Tectonic version is stale."""
+        output, directories, files, stamp = built
+        stamp.unlink()
+        assert not is_up_to_date(output, directories, files, stamp, "Tectonic 0.15.0")
+
+
+class TestComputeBuildKey:
+    """Test the content key of the PDF cache."""
+
+    def key(self, project, document="cv-resume.tex", version="v1", engine="Tectonic 0.15.0"):
+        tex_path = project.base_dir / document
+        _, files = build_inputs(tex_path, version, project)
+        return compute_build_key(tex_path, version, files, project.base_dir, engine)
+
+    def test_key_is_stable(self, project):
+        """Test that unchanged inputs give the same key."""
+        assert self.key(project) == self.key(project)
+
+    def test_key_ignores_mtimes(self, project):
+        """Test that touching an input without changing it keeps the key."""
+        before = self.key(project)
+        set_mtime(project.version_dir("v1") / "experience.tex", 5000)
+        assert self.key(project) == before
+
+    def test_key_changes_with_content(self, project):
+        """Test that editing an input changes the key."""
+        before = self.key(project)
+        (project.version_dir("v1") / "experience.tex").write_text("new role")
+        assert self.key(project) != before
+
+    def test_key_changes_with_engine(self, project):
+        """Test that a Tectonic upgrade changes the key."""
+        assert self.key(project) != self.key(project, engine="Tectonic 0.16.0")
+
+    def test_key_changes_with_document_and_version(self, project):
+        """Test that documents and versions sharing inputs get their own keys."""
+        (project.base_dir / "cv-coverletter.tex").write_text("letter")
+        key = self.key(project)
+        assert key != self.key(project, document="cv-coverletter.tex")
+        assert key != self.key(project, version="v2")
+
+
+class TestPDFCache:
+    """Test restoring and pruning cached PDFs."""
+
+    def make_entry(self, cache_dir, name, seconds):
+        pdf = cache_dir / f"{name}.pdf"
+        pdf.write_bytes(b"%PDF")
+        pdf.with_suffix(".log").write_bytes(b"")
+        set_mtime(pdf, seconds)
+        return pdf
+
+    def test_prune_keeps_newest_entries_per_document(self, tmp_path):
+        """Test that only the newest entries of the pruned document are kept."""
+        for i in range(4):
+            self.make_entry(tmp_path, f"cv-resume-{i:02x}", 1000 + i)
+            self.make_entry(tmp_path, f"cv-coverletter-{i:02x}", 1000 + i)
+        (tmp_path / "cv-resume-ff.pdf.partial").write_bytes(b"")
+
+        prune_cached_builds(tmp_path, "cv-resume", keep=2)
+
+        names = {path.name for path in tmp_path.iterdir()}
+        assert {name for name in names if name.startswith("cv-resume-")} == {
+            "cv-resume-02.pdf", "cv-resume-02.log",
+            "cv-resume-03.pdf", "cv-resume-03.log",
+            "cv-resume-ff.pdf.partial",
+        }
+        assert sum(name.startswith("cv-coverletter-") for name in names) == 8
+
+    def test_prune_missing_cache_dir(self, tmp_path):
+        """Test that pruning a cache that was never created does nothing."""
+        prune_cached_builds(tmp_path / "missing", "cv-resume")
+
+    def test_restore_marks_entry_recently_used(self, tmp_path):
+        """Test that a restored entry survives the next prune."""
+        old = self.make_entry(tmp_path, "cv-resume-00", 1000)
+        self.make_entry(tmp_path, "cv-resume-01", 2000)
+        build_dir = tmp_path / "build"
+        build_dir.mkdir()
+
+        assert restore_cached_build(old, build_dir / "cv-resume.pdf", build_dir / "cv-resume.log")
+        prune_cached_builds(tmp_path, "cv-resume", keep=1)
+
+        assert old.exists()
+        assert (build_dir / "cv-resume.pdf").read_bytes() == b"%PDF"
+
+    def test_restore_missing_entry(self, tmp_path):
+        """Test that a cache miss reports False."""
+        assert not restore_cached_build(tmp_path / "cv-resume-00.pdf",
+                                        tmp_path / "out.pdf", tmp_path / "out.log")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for cover_letter_to_markdown.py
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cover_letter_to_markdown import extract_cover_letter_info
+
+
+class TestExtractLetterBody:
+    """Test comment handling in the letter body."""
+
+    @pytest.fixture
+    def extract_body(self, tmp_path):
+        """Return a function that extracts the paragraphs of a letter body."""
+        def extract(body):
+            cover_letter = tmp_path / "cover_letter.tex"
+            cover_letter.write_text(
+                "\\begin{storedcvletter}{\n" + body + "\n}\\end{storedcvletter}\n",
+                encoding='utf-8'
+            )
+            return extract_cover_letter_info(cover_letter)['body_paragraphs']
+        return extract
+
+    def test_escaped_percent_is_kept(self, extract_body):
+        """Test that an escaped % is text, not the start of a comment."""
+        assert extract_body(r'The project was 50\% done.') == ['The project was 50% done.']
+
+    def test_comment_after_line_break(self, extract_body):
+        """Test that a % after a \\\\ line break starts a comment."""
+        paragraphs = extract_body(r'Some text\\% a comment')
+        assert len(paragraphs) == 1
+        assert paragraphs[0].startswith('Some text')
+        assert 'comment' not in paragraphs[0]
+
+    def test_inline_and_comment_lines(self, extract_body):
+        """Test that comments are removed without splitting paragraphs."""
+        paragraphs = extract_body(
+            'First paragraph % note\n%TODO tighten\ncontinues here.\n\nSecond paragraph.'
+        )
+        assert paragraphs == ['First paragraph continues here.', 'Second paragraph.']
@@ -82,6 +82,53 @@ class TestCVParser:
         assert parser.jobs[0]['company'] == 'Tech Corp'
         assert len(parser.jobs[0]['achievements']) == 2
 
+    def test_parse_experience_with_nested_braces(self, temp_cv_structure):
+        """Test that nested braces in any argument keep the entry and its neighbours."""
+        cv_base, template_dir, test_version = temp_cv_structure
+
+        exp_file = test_version / "experience.tex"
+        exp_file.write_text(r"""\begin{cventries}
+  \cventry{Senior {Data} Engineer}{Tech Corp}{NYC, NY}{2020 - 2023}{
+      \begin{cvitems}
+        \item {Built {scalable} microservices for serving millions of users}
+      \end{cvitems}
+    }
+  \cventry{Engineer}{Start Up}{Boston, MA}{2018 - 2020}{
+      \begin{cvitems}
+        \item {Shipped the first version of the billing platform}
+      \end{cvitems}
+    }
+\end{cventries}
+""")
+
+        parser = CVParser(cv_base)
+        parser.parse_cv_directory(test_version)
+
+        assert [job['titles'][0] for job in parser.jobs] == ['Senior Data Engineer', 'Engineer']
+        assert parser.jobs[0]['company'] == 'Tech Corp'
+        assert parser.jobs[0]['achievements'] == ['Built scalable microservices for serving millions of users']
+        assert parser.jobs[1]['achievements'] == ['Shipped the first version of the billing platform']
+
+    def test_parse_experience_with_crlf_line_endings(self, temp_cv_structure):
+        """Test that Windows line endings parse the same as Unix ones."""
+        cv_base, template_dir, test_version = temp_cv_structure
+
+        exp_file = test_version / "experience.tex"
+        exp_file.write_bytes(b"\\begin{cventries}\r\n"
+                             b"  \\cventry\r\n    {Senior Engineer}\r\n    {Tech Corp}\r\n"
+                             b"    {NYC, NY}\r\n    {2020 - 2023}\r\n    {\r\n"
+                             b"      \\begin{cvitems}\r\n"
+                             b"        \\item {Built scalable microservices architecture}\r\n"
+                             b"      \\end{cvitems}\r\n    }\r\n"
+                             b"\\end{cventries}\r\n")
+
+        parser = CVParser(cv_base)
+        parser.parse_cv_directory(test_version)
+
+        assert len(parser.jobs) == 1
+        assert parser.jobs[0]['location'] == 'NYC, NY'
+        assert parser.jobs[0]['achievements'] == ['Built scalable microservices architecture']
+
     def test_parse_skills(self, temp_cv_structure):
         """Test parsing skills.tex."""
         cv_base, template_dir, test_version = temp_cv_structure
@@ -281,6 +328,34 @@ class TestCVParser:
         # Should be empty because it matches template
         assert len(parser.jobs) == 0
 
+    def test_file_hash_cache_reused_and_invalidated(self, temp_cv_structure):
+        """Test that file hashes persist between runs and follow file edits."""
+        cv_base, template_dir, test_version = temp_cv_structure
+
+        template_exp = template_dir / "experience.tex"
+        template_exp.write_text(r"\cventry{[Job Title]}{[Company]}{[Location]}{[Dates]}{}")
+        test_exp = test_version / "experience.tex"
+        test_exp.write_text(template_exp.read_text())
+
+        parser = CVParser(cv_base)
+        parser.parse_all_cvs()
+        assert parser.jobs == []
+        cache_file = cv_base.parent / ".build_cache" / "cv_hashes.json"
+        assert str(test_exp) in json.loads(cache_file.read_text())["files"]
+
+        # An edited file is hashed again rather than matched from the cache
+        test_exp.write_text(r"""\begin{cventries}
+  \cventry{Senior Engineer}{Tech Corp}{NYC, NY}{2020 - 2023}{
+      \begin{cvitems}
+        \item {Built microservices architecture for cloud platform deployment}
+      \end{cvitems}
+    }
+\end{cventries}
+""")
+        parser = CVParser(cv_base)
+        parser.parse_all_cvs()
+        assert len(parser.jobs) == 1
+
     def test_merge_jobs_by_company(self, temp_cv_structure):
         """Test job merging by company and dates."""
         cv_base, template_dir, test_version = temp_cv_structure
@@ -322,6 +397,41 @@ class TestCVParser:
         assert 'Lead Engineer' in parser.jobs[0]['titles']
         assert len(parser.jobs[0]['achievements']) == 2
 
+    def test_merge_jobs_dedupes_case_and_spacing_variants(self, temp_cv_structure):
+        """Test that bullets differing only in case or spacing are merged once."""
+        cv_base, template_dir, test_version = temp_cv_structure
+
+        parser = CVParser(cv_base)
+        parser.jobs = [
+            {"titles": ["Lead Engineer"], "company": "Tech Corp", "location": "", "dates": "2020 - 2023",
+             "achievements": ["Built the data platform", "Led a team of five"]},
+            {"titles": ["lead engineer"], "company": "Tech Corp", "location": "", "dates": "2020 - 2023",
+             "achievements": ["Built  the Data Platform", "Cut costs by 40%"]},
+        ]
+        parser.merge_jobs()
+
+        assert len(parser.jobs) == 1
+        assert parser.jobs[0]["titles"] == ["Lead Engineer"]
+        assert parser.jobs[0]["achievements"] == [
+            "Built the data platform", "Led a team of five", "Cut costs by 40%"
+        ]
+
+    def test_merge_jobs_sorts_by_end_date(self, temp_cv_structure):
+        """Test that merged jobs are ordered by end date, most recent first."""
+        cv_base, template_dir, test_version = temp_cv_structure
+
+        parser = CVParser(cv_base)
+        for dates in ['2012 - 2015', 'Jan 2021 -- Present', 'May 2017 -- Aug 2017', 'Mar 2018 -- Dec 2020']:
+            parser.jobs.append({"titles": ["Engineer"], "company": dates, "location": "",
+                                "dates": dates, "achievements": []})
+        parser.merge_jobs()
+
+        assert [job["dates"] for job in parser.jobs] == [
+            'Jan 2021 -- Present', 'Mar 2018 -- Dec 2020', 'May 2017 -- Aug 2017', '2012 - 2015'
+        ]
+        assert all(set(job) == {"titles", "company", "location", "dates", "achievements"}
+                   for job in parser.jobs)
+
     def test_export_to_json(self, temp_cv_structure, tmp_path):
         """Test JSON export functionality."""
         cv_base, template_dir, test_version = temp_cv_structure
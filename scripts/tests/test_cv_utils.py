@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from cv_utils import (
     Colors,
     print_status,
+    read_binary_file,
     read_text_file,
     write_text_file,
     read_text_file_safe,
@@ -56,6 +57,24 @@ class TestFileIOUtilities:
         read_content = read_text_file(test_file)
         assert read_content == content
 
+    def test_read_text_file_normalizes_newlines(self, tmp_path):
+        """Test that CRLF and CR line endings read back as LF."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes("caf\u00e9\r\nline two\rline three\n".encode('utf-8'))
+
+        assert read_text_file(test_file) == "caf\u00e9\nline two\nline three\n"
+
+    def test_read_binary_file(self, tmp_path):
+        """Test reading raw bytes, including empty and larger files."""
+        test_file = tmp_path / "test.bin"
+        content = bytes(range(256)) * 1000
+        test_file.write_bytes(content)
+        assert read_binary_file(test_file) == content
+
+        empty_file = tmp_path / "empty.bin"
+        empty_file.write_bytes(b"")
+        assert read_binary_file(empty_file) == b""
+
     def test_read_text_file_safe_existing(self, tmp_path):
         """Test safe reading of existing file."""
         test_file = tmp_path / "test.txt"
@@ -172,6 +172,23 @@ class TestVersionUtils:
         version = get_current_version(version_file)
         assert version is None
 
+    def test_get_current_version_skips_empty_definition(self, tmp_path):
+        """Test get_current_version ignores an empty definition before the real one."""
+        version_file = tmp_path / "cv-version.tex"
+        version_file.write_text(
+            "\\newcommand{\\OutputVersion}{}\n\\newcommand{\\OutputVersion}{second}\n",
+            encoding='utf-8'
+        )
+
+        assert get_current_version(version_file) == "second"
+
+    def test_get_current_version_argument_on_next_line(self, tmp_path):
+        """Test get_current_version reads a definition split across lines."""
+        version_file = tmp_path / "cv-version.tex"
+        version_file.write_text("\\newcommand{\\OutputVersion}\n  {split}\n", encoding='utf-8')
+
+        assert get_current_version(version_file) == "split"
+
     def test_get_version_status_complete(self, tmp_path):
         """Test get_version_status with complete version."""
         version_dir = tmp_path / "test_version"
@@ -272,6 +289,19 @@ class TestVersionUtils:
         name = extract_name_from_personal_details(personal_file)
         assert name == "CV"
 
+    def test_extract_name_sees_file_edits(self, tmp_path):
+        """Test the cached name is re-read after the file changes."""
+        import os
+
+        personal_file = tmp_path / "cv-personal-details.tex"
+        personal_file.write_text(r"\name{John}{Doe}", encoding='utf-8')
+        assert extract_name_from_personal_details(personal_file) == "John Doe"
+
+        personal_file.write_text(r"\name{Jane}{Smith}", encoding='utf-8')
+        st = personal_file.stat()
+        os.utime(personal_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert extract_name_from_personal_details(personal_file) == "Jane Smith"
+
     def test_extract_name_nonexistent_file(self, tmp_path):
         """Test extract_name_from_personal_details with nonexistent file."""
         personal_file = tmp_path / "nonexistent.tex"
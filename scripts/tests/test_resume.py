@@ -58,6 +58,25 @@ class TestVersionDiscovery:
         finally:
             os.chdir(original_cwd)
 
+    def test_get_available_versions_sees_new_directory(self, tmp_path):
+        """Test a version added outside the pipeline shows up on the next call."""
+        import os
+        content_dir = tmp_path / '_content'
+        (content_dir / 'version1').mkdir(parents=True)
+
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+            assert pipeline.get_available_versions() == ['version1']
+
+            (content_dir / 'version2').mkdir()
+            # Guarantee a new mtime even on filesystems with coarse timestamps
+            mtime_ns = content_dir.stat().st_mtime_ns + 1_000_000_000
+            os.utime(content_dir, ns=(mtime_ns, mtime_ns))
+            assert pipeline.get_available_versions() == ['version1', 'version2']
+        finally:
+            os.chdir(original_cwd)
+
     def test_get_version_status_not_found(self, tmp_path):
         """Test status for non-existent version."""
         content_dir = tmp_path / '_content'
@@ -144,6 +163,24 @@ class TestVersionDiscovery:
         finally:
             os.chdir(original_cwd)
 
+    def test_iter_versions_with_status(self, tmp_path):
+        """Test versions are yielded sorted with their status."""
+        content_dir = tmp_path / '_content'
+        (content_dir / 'beta').mkdir(parents=True)
+        (content_dir / 'alpha').mkdir()
+        (content_dir / '_template').mkdir()  # Should be excluded
+        (content_dir / 'alpha' / 'tagline.tex').write_text('Test tagline')
+        (content_dir / 'alpha' / 'experience.tex').write_text('Test experience')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            result = list(pipeline.iter_versions_with_status())
+            assert result == [('alpha', '[Resume Ready]'), ('beta', '[Empty]')]
+        finally:
+            os.chdir(original_cwd)
+
 
 class TestVersionManagement:
     """Tests for version creation and management."""
@@ -190,6 +227,69 @@ class TestVersionManagement:
         finally:
             os.chdir(original_cwd)
 
+    def test_update_version_refreshes_cached_version(self, tmp_path):
+        """Test get_current_version sees a version written by update_version."""
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            pipeline.update_version('first')
+            assert pipeline.get_current_version() == 'first'
+
+            pipeline.update_version('second')
+            assert pipeline.get_current_version() == 'second'
+        finally:
+            os.chdir(original_cwd)
+
+    def test_current_version_sees_external_edit(self, tmp_path):
+        """Test the cached version is re-read when the file changes on disk."""
+        version_file = tmp_path / 'cv-version.tex'
+        version_file.write_text('\\newcommand{\\OutputVersion}{first}\n')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            assert pipeline.get_current_version() == 'first'
+
+            version_file.write_text('\\newcommand{\\OutputVersion}{second_version}\n')
+            assert pipeline.get_current_version() == 'second_version'
+        finally:
+            os.chdir(original_cwd)
+
+    def test_update_version_preserves_other_lines(self, tmp_path):
+        """Test only the OutputVersion line is rewritten."""
+        version_file = tmp_path / 'cv-version.tex'
+        version_file.write_text('% header\n\\newcommand{\\OutputVersion}{old}\n% footer\n')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            pipeline.update_version('new_version')
+            assert version_file.read_text() == (
+                '% header\n\\newcommand{\\OutputVersion}{new_version}\n% footer\n'
+            )
+        finally:
+            os.chdir(original_cwd)
+
+    def test_update_version_with_argument_on_next_line(self, tmp_path):
+        """Test a definition split across two lines is read and replaced whole."""
+        version_file = tmp_path / 'cv-version.tex'
+        version_file.write_text('\\newcommand{\\OutputVersion}\n  {old}\n% footer\n')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            assert pipeline.get_current_version() == 'old'
+            pipeline.update_version('new_version')
+            assert version_file.read_text() == (
+                '\\newcommand{\\OutputVersion}{new_version}\n% footer\n'
+            )
+        finally:
+            os.chdir(original_cwd)
+
 
 class TestValidation:
     """Tests for version validation functionality."""
@@ -260,6 +360,17 @@ class TestValidation:
         finally:
             os.chdir(original_cwd)
 
+    def test_find_control_chars_positions(self):
+        """Test control characters are reported with 1-based line and column."""
+        content = 'ok\tline\r\n\x07a\nabc\x1b\x0b'
+        hits = pipeline._find_control_chars(content)
+        assert hits == [(2, 1, 7), (3, 4, 27), (3, 5, 11)]
+
+    def test_mismatched_brace_lines_ignores_escaped(self):
+        """Test escaped braces are ignored when balancing each line."""
+        content = '\\textbf{ok}\n\\{ literal\n\\section{open\n}'
+        assert pipeline._mismatched_brace_lines(content) == {3, 4}
+
     def test_validate_template_placeholders(self, tmp_path):
         """Test validation warns about template placeholders."""
         content_dir = tmp_path / '_content'
@@ -381,6 +492,71 @@ class TestCleanArtifacts:
         finally:
             os.chdir(original_cwd)
 
+    def test_clean_multi_dot_artifacts_keeps_pdf(self, tmp_path):
+        """Test multi-dot suffixes are cleaned and PDFs survive a normal clean."""
+        (tmp_path / 'cv-resume.synctex.gz').write_text('synctex')
+        (tmp_path / 'cv-resume.run.xml').write_text('run')
+        (tmp_path / 'cv-resume.pdf').write_text('pdf')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            result = pipeline.clean_build_artifacts()
+            assert result is True
+
+            assert not (tmp_path / 'cv-resume.synctex.gz').exists()
+            assert not (tmp_path / 'cv-resume.run.xml').exists()
+            assert (tmp_path / 'cv-resume.pdf').exists()
+        finally:
+            os.chdir(original_cwd)
+
+    def test_clean_nested_pycache_keeps_sources(self, tmp_path):
+        """Test cleaning nested __pycache__ dirs without touching other files."""
+        nested = tmp_path / 'scripts' / 'cv_utils' / '__pycache__'
+        nested.mkdir(parents=True)
+        (nested / 'mod.pyc').write_text('pyc content')
+        source = tmp_path / 'scripts' / 'cv_utils' / 'mod.py'
+        source.write_text('x = 1')
+        keep = tmp_path / 'cv-resume.tex'
+        keep.write_text('tex content')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            result = pipeline.clean_build_artifacts()
+            assert result is True
+
+            assert not nested.exists()
+            assert source.exists()
+            assert keep.exists()
+        finally:
+            os.chdir(original_cwd)
+
+    def test_clean_texmf_copies_in_root(self, tmp_path):
+        """Test root copies of texmf package files are removed, others kept."""
+        texmf_dir = tmp_path / 'texmf'
+        texmf_dir.mkdir()
+        (texmf_dir / 'resume.cls').write_text('class')
+        copied = tmp_path / 'resume.cls'
+        copied.write_text('class')
+        own = tmp_path / 'local.sty'
+        own.write_text('own package')
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            result = pipeline.clean_build_artifacts()
+            assert result is True
+
+            assert not copied.exists()
+            assert own.exists()
+            assert (texmf_dir / 'resume.cls').exists()
+        finally:
+            os.chdir(original_cwd)
+
 
 class TestVersionDuplication:
     """Tests for version duplication."""
@@ -417,6 +593,35 @@ class TestVersionDuplication:
             os.chdir(original_cwd)
 
 
+class TestVersionCreation:
+    """Tests for creating versions from the template."""
+
+    def test_create_copies_template_except_gitignore(self, tmp_path, monkeypatch):
+        """Test template files and subdirectories are copied, .gitignore is not."""
+        template_dir = tmp_path / '_content' / '_template'
+        (template_dir / 'assets').mkdir(parents=True)
+        (template_dir / 'tagline.tex').write_text('Tagline')
+        (template_dir / 'assets' / 'logo.txt').write_text('logo')
+        (template_dir / '.gitignore').write_text('*')
+
+        answers = iter(['y', 'n'])  # confirm creation, don't switch
+        monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(tmp_path)
+            result = pipeline.create_new_version('acme')
+            assert result is True
+
+            new_dir = tmp_path / '_content' / 'acme'
+            assert (new_dir / 'tagline.tex').read_text() == 'Tagline'
+            assert (new_dir / 'assets' / 'logo.txt').read_text() == 'logo'
+            assert not (new_dir / '.gitignore').exists()
+        finally:
+            os.chdir(original_cwd)
+
+
 class TestVersionDeletion:
     """Tests for version deletion."""
 
@@ -451,6 +656,21 @@ class TestVersionDeletion:
             os.chdir(original_cwd)
 
 
+class TestStatus:
+    """Tests for the pipeline status summary."""
+
+    def test_library_entry_count_follows_file_changes(self, tmp_path):
+        """Test library counts are cached per mtime/size and refreshed on change."""
+        lib_file = tmp_path / 'cv_library.json'
+        lib_file.write_text('[{"a": 1}, {"b": 2}]')
+        st = lib_file.stat()
+        assert pipeline._library_entry_count(lib_file, st.st_mtime_ns, st.st_size) == 2
+
+        lib_file.write_text('{"x": 1, "y": 2, "z": 3}')
+        st = lib_file.stat()
+        assert pipeline._library_entry_count(lib_file, st.st_mtime_ns, st.st_size) == 3
+
+
 class TestColorFunctions:
     """Tests for color output functions."""
 
@@ -90,6 +90,12 @@ class TestCleanLatexText:
         assert 'Some text' in result
         assert 'More text' in result
 
+    def test_repeated_calls_respect_options(self):
+        """Test that cached results are kept apart per formatting option."""
+        assert clean_latex_text(r'\textbf{Bold}') == '**Bold**'
+        assert clean_latex_text(r'\textbf{Bold}', convert_bold_italic=False) == 'Bold'
+        assert clean_latex_text(r'\textbf{Bold}') == '**Bold**'
+
 
 class TestExtractCVHonors:
     """Test cvhonors parser for certificates, honors, committees."""
@@ -315,6 +321,20 @@ class TestExtractPersonalInfo:
         assert result['github'] == 'johndoe'
         assert result['linkedin'] == 'johndoe'
 
+    def test_first_definition_wins(self, tmp_path):
+        """Test a repeated command keeps its first value."""
+        content = r"""
+\email{first@example.com}
+\name{John}{Doe}
+\email{second@example.com}
+"""
+        file_path = tmp_path / "cv-personal-details.tex"
+        file_path.write_text(content)
+
+        result = extract_personal_info(file_path)
+
+        assert result == {'email': 'first@example.com', 'name': 'John Doe'}
+
 
 class TestExtractTagline:
     """Test tagline extraction."""